@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+import cotas_comandos
+
+cotas_comandos.cota("depot", "cajas")
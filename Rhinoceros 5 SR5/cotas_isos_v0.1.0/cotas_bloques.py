@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import cotas_geometria as geo
+import cotas_objetos
+
+# Fuente de color y grosor de impresión "por objeto padre"
+SOURCE_BY_PARENT = 3
+
+def arrow_block_name(style):
+    return "Cotas Flecha {} {:g}".format(style["name"], style["arrow_width"])
+
+def tick_block_name(style):
+    return "Cotas Tick {} {:g}".format(style["name"], style["tick_length"])
+
+def add_block_definition(objects, block_name, layer_name):
+    for obj in objects:
+        rs.ObjectColorSource(obj, SOURCE_BY_PARENT)
+        rs.ObjectPrintWidthSource(obj, SOURCE_BY_PARENT)
+    if layer_name and rs.IsLayer(layer_name):
+        rs.ObjectLayer(objects, layer_name)
+    return rs.AddBlock(objects, (0, 0, 0), block_name, True)
+
+def arrow_block(style):
+    block_name = arrow_block_name(style)
+    if rs.IsBlock(block_name):
+        return block_name
+    points = [(x, y, 0) for x, y in geo.mark_template(style)]
+    arrow_curve = rs.AddPolyline(points)
+    hatch = rs.AddHatch(arrow_curve, "Solid")
+    return add_block_definition([obj for obj in (arrow_curve, hatch) if obj], block_name, style.get("layer"))
+
+def tick_block(style):
+    block_name = tick_block_name(style)
+    if rs.IsBlock(block_name):
+        return block_name
+    start_pt, end_pt = [(x, y, 0) for x, y in geo.mark_template(style)]
+    tick_line = rs.AddLine(start_pt, end_pt)
+    return add_block_definition([tick_line], block_name, style.get("layer"))
+
+def mark_block(style):
+    if style.get("tick_length"):
+        return tick_block(style)
+    return arrow_block(style)
+
+def block_id(block_name):
+    definition = sc.doc.InstanceDefinitions.Find(block_name, True)
+    return definition.Id if definition else None
+
+def insert_block(block_name, xform):
+    # Como rs.InsertBlock2, pero creada ya con cotas_objetos.attributes()
+    definition = sc.doc.InstanceDefinitions.Find(block_name, True)
+    if definition is None:
+        return None
+    return cotas_objetos.add_instance(definition.Index, xform)
+
+def insert_arrow(point, vector, style):
+    xform = geo.frame_transform(point, geo.direction_frame(vector))
+    return insert_block(arrow_block(style), xform)
+
+def insert_tick(point, direction, style):
+    # El tick del bloque va sobre Y; se gira para que quede a lo largo de direction
+    xform = geo.frame_transform(point, geo.perpendicular_frame(direction))
+    return insert_block(tick_block(style), xform)
+
+def insert_dimension_marks(start_pt, end_pt, style):
+    # Un solo marco por cota: la marca final sigue la línea y la inicial la mira al revés
+    block_name = mark_block(style)
+    start_frame, end_frame = geo.dimension_frame(start_pt, end_pt)
+    return [insert_block(block_name, geo.frame_transform(start_pt, start_frame)),
+            insert_block(block_name, geo.frame_transform(end_pt, end_frame))]
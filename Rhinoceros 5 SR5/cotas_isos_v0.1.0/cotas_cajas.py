@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# Cotas isométricas externas de todas las cajas de una selección. Las líneas se pasan a
+# un grafo cuyos vértices se indexan por sus coordenadas redondeadas a la tolerancia, con
+# los vecinos de cada vértice separados por eje isométrico. Una caja es una esquina con
+# un tramo en cada eje cuyas nueve aristas visibles (la "Y" y el hexágono del contorno)
+# están dibujadas; de cada una sale la misma cota que dibuja a mano la cota externa:
+# altura, profundidad y anchura sobre su contorno izquierdo y superior. Los textos son,
+# como en la cota externa con textos en lote, los de referencia más cercanos a cada
+# arista; sin textos seleccionados, la longitud dibujada, para cajas a escala 1:1.
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import cotas_capas
+import cotas_constructor
+import cotas_geometria as geo
+import cotas_objetos
+import cotas_textos
+import cotas_transaccion
+
+# Profundidad por el eje de 30° y anchura por el de 150°, como en la cota externa
+DEPTH_AXIS = 30.0
+WIDTH_AXIS = 150.0
+
+def line_segments(curves):
+    # [(inicio, fin)] de las líneas y polilíneas seleccionadas; las curvas se ignoran
+    segments = []
+    for curve in curves:
+        if rs.IsPolyline(curve):
+            points = [geo.point3d(pt) for pt in rs.PolylineVertices(curve)]
+        elif rs.IsLine(curve):
+            points = [geo.point3d(rs.CurveStartPoint(curve)), geo.point3d(rs.CurveEndPoint(curve))]
+        else:
+            continue
+        segments.extend(zip(points[:-1], points[1:]))
+    return segments
+
+class LineGraph(object):
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.index = {}
+        self.points = []
+        # Por vértice, {eje: vértices vecinos por ese eje}
+        self.neighbours = []
+
+    def key(self, point):
+        return (int(round(point[0] / self.tolerance)), int(round(point[1] / self.tolerance)))
+
+    def find(self, point):
+        # Busca también en las celdas vecinas: dos puntos a menos de la tolerancia pueden
+        # caer a uno y otro lado de un redondeo
+        x, y = self.key(point)
+        for key in [(x, y)] + [(x + i, y + j) for i in (-1, 0, 1) for j in (-1, 0, 1) if i or j]:
+            vertex = self.index.get(key)
+            if vertex is not None:
+                return vertex
+        return None
+
+    def vertex(self, point):
+        vertex = self.find(point)
+        if vertex is None:
+            vertex = len(self.points)
+            self.index[self.key(point)] = vertex
+            self.points.append(point)
+            self.neighbours.append({})
+        return vertex
+
+    def add_segments(self, segments):
+        # Los tramos que no siguen un eje isométrico no forman parte de ninguna caja
+        axes = geo.classify_iso_axes([start for start, end in segments], [end for start, end in segments])
+        for (start, end), axis in zip(segments, axes):
+            if axis is None:
+                continue
+            i, j = self.vertex(start), self.vertex(end)
+            if i != j:
+                self.neighbours[i].setdefault(axis, set()).add(j)
+                self.neighbours[j].setdefault(axis, set()).add(i)
+
+    def connected(self, start, end, axis):
+        # Si se llega de start a end por tramos del eje, aunque la arista esté partida
+        if start is None or end is None:
+            return False
+        target = self.points[end]
+        current = start
+        while current != end:
+            remaining = geo.distance(self.points[current], target)
+            closer = [(geo.distance(self.points[vertex], target), vertex)
+                      for vertex in self.neighbours[current].get(axis, ())]
+            closer = [pair for pair in closer if pair[0] < remaining - self.tolerance]
+            if not closer:
+                return False
+            current = min(closer)[1]
+        return True
+
+def box_frame(corner, a, b, v):
+    # Misma caja vista desde su esquina superior delantera: v hacia abajo, a y b hacia arriba
+    if v[1] > 0:
+        corner, v = geo.add(corner, v), geo.reverse(v)
+    if a[1] < 0:
+        corner, a = geo.add(corner, a), geo.reverse(a)
+    if b[1] < 0:
+        corner, b = geo.add(corner, b), geo.reverse(b)
+    return corner, a, b, v
+
+def is_box(graph, corner, a, b, v):
+    # Las nueve aristas visibles desde la esquina superior delantera
+    points = {
+        "c": corner, "a": geo.add(corner, a), "b": geo.add(corner, b), "v": geo.add(corner, v),
+        "ab": geo.add(geo.add(corner, a), b), "av": geo.add(geo.add(corner, a), v),
+        "bv": geo.add(geo.add(corner, b), v),
+    }
+    vertices = dict((name, graph.find(point)) for name, point in points.items())
+    edges = [("c", "a", DEPTH_AXIS), ("c", "b", WIDTH_AXIS), ("c", "v", geo.ISO_VERTICAL),
+             ("a", "ab", WIDTH_AXIS), ("b", "ab", DEPTH_AXIS),
+             ("a", "av", geo.ISO_VERTICAL), ("v", "av", DEPTH_AXIS),
+             ("b", "bv", geo.ISO_VERTICAL), ("v", "bv", WIDTH_AXIS)]
+    return all(graph.connected(vertices[start], vertices[end], axis) for start, end, axis in edges)
+
+def find_boxes(graph):
+    # [(esquina superior delantera, a, b, v)] de cada caja, una sola vez aunque estén
+    # dibujadas también las aristas ocultas
+    boxes = []
+    seen = set()
+    for vertex, around in enumerate(graph.neighbours):
+        corner = graph.points[vertex]
+        for depth_end in around.get(DEPTH_AXIS, ()):
+            for width_end in around.get(WIDTH_AXIS, ()):
+                for height_end in around.get(geo.ISO_VERTICAL, ()):
+                    frame = box_frame(corner, geo.subtract(graph.points[depth_end], corner),
+                                      geo.subtract(graph.points[width_end], corner),
+                                      geo.subtract(graph.points[height_end], corner))
+                    key = tuple(graph.key(geo.add(frame[0], vector)) for vector in ((0, 0, 0),) + frame[1:])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if is_box(graph, *frame):
+                        boxes.append(frame)
+    return boxes
+
+def box_outline(corner, a, b, v):
+    # Contorno izquierdo y superior, en el orden de la cota externa: altura, profundidad, anchura
+    left_top = geo.add(corner, b)
+    return [geo.add(left_top, v), left_top, geo.add(left_top, a), geo.add(corner, a)]
+
+def add_box_dimensions(style):
+    # style: perfil de la cota externa de la marca, ver cotas_motor.profile
+    base_layer_name = style["layer"]
+    line_color = style["layer_color"]
+    print_width = style["print_width"]
+    current_layer = rs.CurrentLayer()
+
+    curves = rs.GetObjects("Seleccione las líneas de las cajas a acotar", rs.filter.curve, preselect=True)
+    if not curves:
+        return
+
+    graph = LineGraph(rs.UnitAbsoluteTolerance())
+    graph.add_segments(line_segments(curves))
+    boxes = find_boxes(graph)
+    if not boxes:
+        print("No se encontraron cajas isométricas en la selección.")
+        return
+
+    offset_distance = rs.GetReal("Distancia de las cotas a las cajas", 2.0 * style["text_height"])
+    if offset_distance is None:
+        return
+
+    # Todos los contornos desfasados hacia fuera de una vez
+    outlines = [box_outline(*box) for box in boxes]
+    offsets = geo.offset_polylines(outlines, [offset_distance] * len(outlines), None)
+
+    # Una sola selección de textos para todas las aristas, repartidos por cercanía
+    midpoints = [geo.midpoints(vertices[0::3], vertices[1::3]) if vertices else [] for vertices in offsets]
+    text_ids = rs.GetObjects("Seleccione los textos de las medidas (Intro: longitudes dibujadas, escala 1:1)",
+                             rs.filter.annotation)
+    if text_ids:
+        contents = iter(cotas_textos.assign_texts(text_ids, [pt for points in midpoints for pt in points]))
+        box_texts = [[next(contents) for point in points] for points in midpoints]
+    else:
+        box_texts = [[cotas_constructor.format_dimension_text(geo.length(vector)) for vector in (v, a, b)]
+                     for corner, a, b, v in boxes]
+
+    # Una sola transacción para todas las cajas, como el lote de cotas lineales
+    transaction = cotas_transaccion.Transaction("Cotas de cajas isométricas")
+    transaction.begin()
+    completed = False
+    try:
+        cotas_capas.set_layer_properties(base_layer_name, line_color, print_width)
+        cota_layer_name = cotas_capas.add_cota_layer(base_layer_name, line_color, print_width)[1]
+        rs.CurrentLayer(cota_layer_name)
+
+        groups = []
+        dimensioned = 0
+        for vertices, points, texts in zip(offsets, midpoints, box_texts):
+            sc.escape_test()
+            if vertices is None:
+                continue
+            cota_id = cotas_capas.new_cota_id()
+            cotas_capas.begin_cota(cota_id, line_color, print_width)
+            line_attrs = cotas_objetos.attributes(color=line_color, print_width=print_width)
+            text_attrs = cotas_objetos.attributes(color=line_color)
+            created_objects = [cotas_objetos.add_polyline(vertices, line_attrs)]
+            for text, point in zip(texts, points):
+                if text is not None:
+                    created_objects.append(cotas_objetos.add_text(text, point, style["text_height"],
+                                                                  style["font"], attrs=text_attrs))
+            created_objects = [obj for obj in created_objects if obj]
+            # En modo capa de marca tag_cota nombra este mismo grupo con el ID de la cota
+            groups.append((None, created_objects))
+            cotas_capas.tag_cota(created_objects, cota_id, line_color, print_width, groups)
+            dimensioned += 1
+        cotas_objetos.add_groups(groups)
+
+        print("Cajas acotadas: {}".format(dimensioned))
+        completed = True
+
+    except Exception as e:
+        print("Error: ", str(e))
+    finally:
+        rs.CurrentLayer(current_layer)
+        rs.UnselectAllObjects()
+        cotas_capas.purge_tracked_sublayers(base_layer_name)
+        transaction.end(completed)
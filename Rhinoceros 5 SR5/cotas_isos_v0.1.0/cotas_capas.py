@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import time
+import Rhino
+import cotas_marcas
+import cotas_objetos
+
+SUBLAYER_PREFIX = "cota-"
+COTA_ID_KEY = "cota_id"
+
+BRAND_LAYER_ENTRY = "cotas_en_capa_de_marca"
+
+# {DocumentId: {capa: (índice, color, grosor de impresión)}} de las capas ya configuradas
+LAYER_REGISTRY_KEY = "cotas_isos.registro_capas"
+LAYER_EVENT_KEY = "cotas_isos.registro_capas.evento"
+
+# Contador de IDs de cota de la sesión de Rhino. Arranca en la hora actual en milisegundos
+# para no repetir los IDs que dejaron sesiones anteriores en el mismo documento
+COTA_COUNTER_KEY = "cotas_isos.contador_cotas"
+
+# Subcapas creadas por los scripts en esta sesión de Rhino que aún no se han revisado
+PENDING_SUBLAYERS_KEY = "cotas_isos.subcapas_pendientes"
+
+def _on_layer_table_event(sender, e):
+    # Una capa nueva o el cambio de capa actual no invalidan lo registrado
+    event_types = Rhino.DocObjects.Tables.LayerTableEventType
+    if e.EventType == event_types.Added or e.EventType == event_types.Current:
+        return
+    layers = sc.sticky.get(LAYER_REGISTRY_KEY, {}).get(e.Document.DocumentId)
+    if not layers:
+        return
+    for layer_name, entry in list(layers.items()):
+        if entry[0] == e.LayerIndex:
+            del layers[layer_name]
+
+def layer_registry():
+    if LAYER_EVENT_KEY not in sc.sticky:
+        Rhino.RhinoDoc.LayerTableEvent += _on_layer_table_event
+        sc.sticky[LAYER_EVENT_KEY] = _on_layer_table_event
+    registry = sc.sticky.setdefault(LAYER_REGISTRY_KEY, {})
+    return registry.setdefault(sc.doc.DocumentId, {})
+
+def set_layer_properties(layer_name, color, print_width, update_color=False):
+    # Sin cambios desde la última vez no se toca la tabla de capas
+    layers = layer_registry()
+    color = tuple(color)
+    entry = layers.get(layer_name)
+    if entry and entry[2] == print_width and (not update_color or entry[1] == color):
+        return
+
+    if not rs.IsLayer(layer_name):
+        rs.AddLayer(layer_name, color=color)
+    elif update_color:
+        rs.LayerColor(layer_name, color)
+    rs.LayerPrintWidth(layer_name, print_width)
+    index = sc.doc.Layers.FindByFullPath(layer_name, True)
+    if index >= 0:
+        layers[layer_name] = (index, color if update_color else None, print_width)
+
+def brand_layer_mode():
+    return rs.GetDocumentData(cotas_marcas.DOCUMENT_SECTION, BRAND_LAYER_ENTRY) == "1"
+
+def set_brand_layer_mode(enabled):
+    rs.SetDocumentData(cotas_marcas.DOCUMENT_SECTION, BRAND_LAYER_ENTRY, "1" if enabled else "0")
+
+def new_cota_id():
+    # Mismo formato que los 8 primeros caracteres de un uuid4, sin importar uuid
+    counter = sc.sticky.get(COTA_COUNTER_KEY)
+    if counter is None:
+        counter = int(time.time() * 1000)
+    counter = (counter + 1) & 0xFFFFFFFF
+    sc.sticky[COTA_COUNTER_KEY] = counter
+    return SUBLAYER_PREFIX + "{:08x}".format(counter)
+
+def begin_cota(cota_id, color, print_width):
+    # En modo capa de marca lo que se cree desde aquí con cotas_objetos sale ya con el color,
+    # el grosor y el ID de la cota; tag_cota solo reescribe lo que no pasó por ahí
+    if brand_layer_mode():
+        cotas_objetos.set_cota_attributes(color, print_width, {COTA_ID_KEY: cota_id})
+    else:
+        cotas_objetos.clear_cota_attributes()
+
+def add_cota_layer(base_layer_name, color, print_width):
+    # Devuelve el ID de la cota y la capa donde dibujarla: su propia subcapa cota-xxxxxxxx
+    # o, en modo capa de marca, la capa de la marca
+    cota_id = new_cota_id()
+    begin_cota(cota_id, color, print_width)
+    if brand_layer_mode():
+        return cota_id, base_layer_name
+    layer_name = base_layer_name + "::" + cota_id
+    if not rs.IsLayer(layer_name):
+        rs.AddLayer(cota_id, color=color, parent=base_layer_name)
+        track_sublayer(layer_name)
+        rs.LayerPrintWidth(layer_name, print_width)
+    return cota_id, layer_name
+
+def tag_cota(object_ids, cota_id, color, print_width, groups=None):
+    # En modo capa de marca cada cota se reconoce por un grupo con su ID y el texto de usuario
+    # cota_id; el color y el grosor que antes daba la subcapa pasan a cada objeto. El grupo
+    # es el que ya tenía la cota (o el pendiente en groups), con su ID como nombre.
+    object_ids = [obj for obj in object_ids if obj]
+    if not object_ids or not brand_layer_mode():
+        return
+    untagged = [obj for obj in object_ids if not cotas_objetos.has_user_text(obj, COTA_ID_KEY, cota_id)]
+    if untagged:
+        cotas_objetos.modify_attributes(untagged, color, print_width, user_text={COTA_ID_KEY: cota_id})
+    if groups is None:
+        cotas_objetos.name_group(object_ids, cota_id)
+    else:
+        cotas_objetos.name_pending_group(groups, object_ids, cota_id)
+
+def pending_sublayers():
+    pending = sc.sticky.get(PENDING_SUBLAYERS_KEY)
+    if pending is None:
+        pending = set()
+        sc.sticky[PENDING_SUBLAYERS_KEY] = pending
+    return pending
+
+def track_sublayer(layer_name):
+    pending_sublayers().add(layer_name)
+
+def purge_tracked_sublayers(base_layer_name=None):
+    # Solo revisa las subcapas anotadas con track_sublayer, no todos los hijos de la capa base.
+    # Las que no se pueden borrar todavía (p. ej. la capa actual) quedan para la próxima vez.
+    pending = pending_sublayers()
+    for layer in list(pending):
+        if base_layer_name and not layer.startswith(base_layer_name + "::"):
+            continue
+        if not rs.IsLayer(layer) or not rs.IsLayerEmpty(layer) or rs.DeleteLayer(layer):
+            pending.discard(layer)
+
+def sweep_empty_sublayers(prefix=SUBLAYER_PREFIX):
+    # Limpieza completa de todas las subcapas cota-* vacías del documento
+    deleted = 0
+    for layer in rs.LayerNames() or []:
+        if not layer.split("::")[-1].startswith(prefix) or not rs.IsLayer(layer):
+            continue
+        if rs.IsLayerEmpty(layer) and not rs.LayerChildren(layer) and rs.DeleteLayer(layer):
+            deleted += 1
+    pending_sublayers().clear()
+    return deleted
+
+def sublayer_cotas(objects, cota_id):
+    # [(ID, objetos)] de las cotas de una subcapa. Las de un lote o de cajas comparten
+    # subcapa y cada una tiene su grupo: cada grupo es una cota con un ID nuevo. Una subcapa
+    # con un solo grupo es una sola cota, con el ID de la subcapa y todos sus objetos, y lo
+    # que no tiene grupo en una subcapa compartida también se queda con ese ID.
+    grouped = {}
+    names = []
+    for obj in objects:
+        groups = rs.ObjectGroups(obj)
+        name = groups[0] if groups else None
+        if name not in grouped:
+            grouped[name] = []
+            names.append(name)
+        grouped[name].append(obj)
+    if len([name for name in names if name is not None]) <= 1:
+        return [(cota_id, objects)]
+    return [(cota_id if name is None else new_cota_id(), grouped[name]) for name in names]
+
+def compact_sublayers(prefix=SUBLAYER_PREFIX):
+    # Pasa las cotas de cada subcapa cota-* a su capa padre, cada una con su grupo nombrado
+    # por su ID, y borra la subcapa. Los objetos que tomaban color o grosor de la subcapa los conservan
+    # como propios.
+    compacted = 0
+    for layer in rs.LayerNames() or []:
+        parent, _, cota_id = layer.rpartition("::")
+        if not parent or not cota_id.startswith(prefix) or not rs.IsLayer(layer):
+            continue
+        objects = rs.ObjectsByLayer(layer)
+        if objects:
+            color = rs.LayerColor(layer)
+            print_width = rs.LayerPrintWidth(layer)
+            for group_id, members in sublayer_cotas(objects, cota_id):
+                cotas_objetos.name_group(members, group_id)
+                for obj in members:
+                    cotas_objetos.modify_attributes([obj],
+                                                    color if rs.ObjectColorSource(obj) == 0 else None,
+                                                    print_width if rs.ObjectPrintWidthSource(obj) == 0 else None,
+                                                    parent, {COTA_ID_KEY: group_id})
+                compacted += 1
+        if not rs.LayerChildren(layer):
+            rs.DeleteLayer(layer)
+    pending_sublayers().clear()
+    return compacted
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Todos los comandos de la barra de herramientas como funciones de un módulo residente.
+# Rhino lo importa en el primer clic y lo conserva el resto de la sesión; cada botón
+# apunta a un script de dos líneas que solo llama a una de estas funciones, así que en
+# los clics siguientes no hay nada que leer ni compilar más allá de ese script.
+# Cada comando importa solo los módulos que usa, para que el primer clic de un botón
+# de modo no cargue el motor de cotas entero.
+import rhinoscriptsyntax as rs
+import sys
+
+def _command(function):
+    # Con el perfil de arranque activo, cada comando termina con su informe
+    def run(*args):
+        try:
+            return function(*args)
+        finally:
+            profile = sys.modules.get("cotas_perfil")
+            if profile is not None:
+                profile.report()
+    run.__name__ = function.__name__
+    return run
+
+@_command
+def cota(brand, kind):
+    # brand: clave de cotas_marcas.BRANDS; kind: lineal, alineada, lote, interna, externa, cajas o hombre-objeto
+    import cotas_motor
+    return cotas_motor.run(brand, kind)
+
+@_command
+def configuracion_inicial():
+    # Importa dim_style.3dm y deja "Base" como estilo de cota actual
+    import os
+    import_file_path = os.path.join(os.path.dirname(__file__), "dim_style.3dm")
+    rs.Command('_-Import "{}" _Enter'.format(import_file_path), True)
+    if "Base" in (rs.DimStyleNames() or []):
+        rs.CurrentDimStyle("Base")
+    else:
+        print("El estilo de cota 'Base' no se encontró en el archivo importado.")
+
+@_command
+def modo_cotas_vivas():
+    import cotas_constructor
+    enabled = not cotas_constructor.live_dimensions_enabled()
+    cotas_constructor.set_live_dimensions(enabled)
+    if enabled:
+        print("Cotas vivas activadas: cada cota se guarda como un solo objeto de cota.")
+    else:
+        print("Cotas vivas desactivadas: cada cota se dibuja como líneas, flechas y texto.")
+
+@_command
+def modo_capa_de_marca():
+    import cotas_capas
+    enabled = not cotas_capas.brand_layer_mode()
+    cotas_capas.set_brand_layer_mode(enabled)
+    if enabled:
+        print("Cotas en la capa de la marca: cada cota se identifica por su grupo y su ID, sin subcapa propia.")
+    else:
+        print("Cotas en subcapas: cada cota nueva se dibuja en su propia subcapa cota-xxxxxxxx.")
+
+@_command
+def modo_textos_en_lote():
+    import cotas_textos
+    enabled = not cotas_textos.batch_texts_mode()
+    cotas_textos.set_batch_texts_mode(enabled)
+    if enabled:
+        print("Textos en lote activados: la cota externa pide todos sus textos con una sola selección.")
+    else:
+        print("Textos en lote desactivados: la cota externa pide cada texto por separado.")
+
+@_command
+def modo_perfil_arranque():
+    import cotas_perfil
+    enabled = not cotas_perfil.profiling()
+    cotas_perfil.set_profiling(enabled)
+    if enabled:
+        print("Perfil de arranque activado: cada clic vuelve a importar los módulos de cotas y escribe cuánto tardó.")
+    else:
+        print("Perfil de arranque desactivado.")
+
+@_command
+def limpiar_subcapas():
+    import cotas_capas
+    rs.EnableRedraw(False)
+    try:
+        deleted = cotas_capas.sweep_empty_sublayers()
+    finally:
+        rs.EnableRedraw(True)
+    print("Subcapas de cota vacías eliminadas: {}".format(deleted))
+
+@_command
+def compactar_subcapas():
+    # Fuera de cotas_transaccion.run: su rollback borra lo creado, pero no devolvería los
+    # objetos a sus subcapas ni las subcapas borradas. Cada subcapa se vacía entera antes
+    # de borrarla y todo el comando queda en un solo paso de deshacer.
+    import cotas_capas
+    import scriptcontext as sc
+    undo_record = sc.doc.BeginUndoRecord("Compactar subcapas de cota")
+    rs.EnableRedraw(False)
+    try:
+        compacted = cotas_capas.compact_sublayers()
+    finally:
+        rs.EnableRedraw(True)
+        if undo_record:
+            sc.doc.EndUndoRecord(undo_record)
+    print("Cotas pasadas a la capa de su marca: {}".format(compacted))
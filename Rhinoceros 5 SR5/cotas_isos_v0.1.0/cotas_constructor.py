@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import math
+import cotas_bloques
+import cotas_geometria as geo
+import cotas_marcas
+import cotas_objetos
+import cotas_transaccion
+
+# Justificación de rs.AddText
+TEXT_BOTTOM_CENTER = 65538
+TEXT_MIDDLE_CENTER = 131074
+
+# Alineación de texto de rs.DimStyleTextAlignment
+DIM_TEXT_HORIZONTAL = 1
+DIM_TEXT_ABOVE = 2
+
+LIVE_DIMENSIONS_ENTRY = "cotas_vivas"
+
+def format_dimension_text(dim_value_mm):
+    dim_value_cm = float(dim_value_mm) / 10.0
+    dim_value_in = float(dim_value_mm) / 25.4
+    dim_text_cm = "{:.1f} cm".format(dim_value_cm).replace('.', ',')
+    dim_text_in = '{:.1f}"'.format(dim_value_in).replace('.', ',')
+    return "{}\n{}".format(dim_text_cm, dim_text_in)
+
+def live_dimensions_enabled():
+    return rs.GetDocumentData(cotas_marcas.DOCUMENT_SECTION, LIVE_DIMENSIONS_ENTRY) == "1"
+
+def set_live_dimensions(enabled):
+    rs.SetDocumentData(cotas_marcas.DOCUMENT_SECTION, LIVE_DIMENSIONS_ENTRY, "1" if enabled else "0")
+
+def read_dim_style(dim_style_name="Base"):
+    if dim_style_name not in (rs.DimStyleNames() or []):
+        dim_style_name = rs.CurrentDimStyle()
+    return {
+        "name": dim_style_name,
+        "live": live_dimensions_enabled(),
+        "extension": rs.DimStyleExtension(dim_style_name),
+        "offset": rs.DimStyleOffset(dim_style_name),
+        "text_gap": rs.DimStyleTextGap(dim_style_name),
+        "text_height": rs.DimStyleTextHeight(dim_style_name),
+    }
+
+def get_dimension_points():
+    ask = cotas_transaccion.ask
+    start_pt = ask(rs.GetPoint, "Primer punto de la cota")
+    if not start_pt:
+        return None
+    end_pt = ask(rs.GetPoint, "Segundo punto de la cota", start_pt)
+    if not end_pt:
+        return None
+    location_pt = ask(rs.GetPoint, "Ubicación de la línea de cota", end_pt)
+    if not location_pt:
+        return None
+    return start_pt, end_pt, location_pt
+
+def linear_axis(start_pt, end_pt, location_pt):
+    # Igual que _Dim: vertical si la ubicación cae fuera del rango en X de los puntos
+    min_x, max_x = sorted([start_pt[0], end_pt[0]])
+    min_y, max_y = sorted([start_pt[1], end_pt[1]])
+    if min_x <= location_pt[0] <= max_x:
+        return (1, 0, 0)
+    if min_y <= location_pt[1] <= max_y:
+        return (0, 1, 0)
+    if max_x - min_x >= max_y - min_y:
+        return (1, 0, 0)
+    return (0, 1, 0)
+
+def aligned_axis(start_pt, end_pt):
+    return geo.unitize(geo.subtract(geo.point3d(end_pt), geo.point3d(start_pt)))
+
+def upright_axis(axis):
+    # La dirección de lectura del texto siempre va hacia la derecha o hacia arriba
+    if axis[0] < -1e-9 or (abs(axis[0]) <= 1e-9 and axis[1] < 0):
+        return geo.reverse(axis)
+    return axis
+
+def add_dimension(start_pt, end_pt, location_pt, axis, style, dim_style, groups=None):
+    start_pt, end_pt, location_pt = geo.point3d(start_pt), geo.point3d(end_pt), geo.point3d(location_pt)
+    axis = upright_axis(axis)
+    normal = geo.perpendicular(axis)
+
+    # Proyección de los puntos medidos sobre la línea de cota
+    start_dist = geo.dot(geo.subtract(location_pt, start_pt), normal)
+    end_dist = geo.dot(geo.subtract(location_pt, end_pt), normal)
+    dim_start = geo.offset_point(start_pt, normal, start_dist)
+    dim_end = geo.offset_point(end_pt, normal, end_dist)
+    if geo.dot(geo.subtract(dim_end, dim_start), axis) < 0:
+        dim_start, dim_end = dim_end, dim_start
+        start_pt, end_pt = end_pt, start_pt
+        start_dist, end_dist = end_dist, start_dist
+
+    dim_value = geo.distance(dim_start, dim_end)
+    if dim_value <= rs.UnitAbsoluteTolerance():
+        raise Exception("Los puntos de la cota coinciden")
+
+    # Las líneas y el texto se crean ya con el grosor y el color de la marca
+    line_attributes = cotas_objetos.attributes(print_width=style["print_width"])
+    created_objects = []
+    try:
+        dim_line = cotas_objetos.add_line(dim_start, dim_end, line_attributes)
+        created_objects.append(dim_line)
+
+        extension_lines = []
+        for point, dist, dim_point in ((start_pt, start_dist, dim_start), (end_pt, end_dist, dim_end)):
+            if abs(dist) <= dim_style["offset"]:
+                continue
+            direction = normal if dist > 0 else geo.reverse(normal)
+            ext_start = geo.offset_point(point, direction, dim_style["offset"])
+            ext_end = geo.offset_point(dim_point, direction, dim_style["extension"])
+            extension_lines.append(cotas_objetos.add_line(ext_start, ext_end, line_attributes))
+        created_objects.extend(extension_lines)
+
+        end_marks = []
+        if style.get("tick_length") or style.get("arrow_width"):
+            end_marks = cotas_bloques.insert_dimension_marks(dim_start, dim_end, style)
+        end_marks = [obj for obj in end_marks if obj]
+        created_objects.extend(end_marks)
+
+        # En un lote el grupo se anota en groups y se crea al final con los demás
+        if groups is None:
+            cotas_objetos.add_group([dim_line] + end_marks)
+        else:
+            groups.append((None, [dim_line] + end_marks))
+
+        # Las cotas más altas que anchas llevan el texto girado -90° y centrado en la línea
+        midpoint = geo.midpoint(dim_start, dim_end)
+        text_height = style.get("text_height") or dim_style["text_height"]
+        if abs(dim_end[1] - dim_start[1]) > abs(dim_end[0] - dim_start[0]):
+            text_plane = rs.PlaneFromFrame(midpoint, geo.reverse(normal), axis)
+            justification = TEXT_MIDDLE_CENTER
+        else:
+            text_origin = geo.offset_point(midpoint, normal, dim_style["text_gap"])
+            text_plane = rs.PlaneFromFrame(text_origin, axis, normal)
+            justification = TEXT_BOTTOM_CENTER
+        text_obj = cotas_objetos.add_text(format_dimension_text(dim_value), text_plane, text_height,
+                                          style["font"], justification,
+                                          cotas_objetos.attributes(color=style["layer_color"]))
+        if text_obj:
+            created_objects.append(text_obj)
+    except Exception:
+        for obj in created_objects:
+            if rs.IsObject(obj):
+                rs.DeleteObject(obj)
+        raise
+
+    return created_objects
+
+def configure_arrowheads(dim_style_name, style):
+    # Rhino 5 solo ofrece la flecha triangular; las versiones con ArrowType1 aceptan
+    # el bloque de flecha o tick de la marca, o ninguna punta
+    index = sc.doc.DimStyles.Find(dim_style_name, True)
+    if index < 0:
+        return
+    dim_style = sc.doc.DimStyles[index]
+    if not hasattr(dim_style, "ArrowType1"):
+        return
+    arrow_types = type(dim_style.ArrowType1)
+    has_marks = style.get("tick_length") or style.get("arrow_width")
+    if hasattr(dim_style, "ArrowBlockId1") and has_marks:
+        arrow_block = cotas_bloques.mark_block(style)
+        dim_style.ArrowType1 = arrow_types.UserBlock
+        dim_style.ArrowType2 = arrow_types.UserBlock
+        dim_style.ArrowBlockId1 = cotas_bloques.block_id(arrow_block)
+        dim_style.ArrowBlockId2 = dim_style.ArrowBlockId1
+    else:
+        if style.get("tick_length"):
+            arrow_type = arrow_types.Tick
+        elif has_marks:
+            arrow_type = arrow_types.SolidTriangle
+        else:
+            arrow_type = getattr(arrow_types, "None")
+        dim_style.ArrowType1 = arrow_type
+        dim_style.ArrowType2 = arrow_type
+    sc.doc.DimStyles.Modify(dim_style, index, True)
+
+def dim_style_settings(style, dim_style, horizontal_text):
+    # (nombre, [(función rs.DimStyle*, valor)]) del estilo de una marca y un tipo de cota.
+    # El nombre lleva la marca de los extremos, su tamaño y la altura del texto, así que
+    # dos tipos de cota de la misma marca solo comparten estilo si se dibujan igual.
+    text_height = style.get("text_height") or dim_style["text_height"]
+    if style.get("tick_length"):
+        mark, mark_size = "tick", style["tick_length"]
+        arrow_size = style["tick_length"]
+    elif style.get("arrow_width"):
+        # Largo de la flecha de la marca: lados a ±150° del eje
+        mark, mark_size = "flecha", style["arrow_width"]
+        arrow_size = style["arrow_width"] * math.cos(math.radians(30))
+    else:
+        mark, mark_size = "sin marca", 0
+        arrow_size = 0.0
+    name = "{} {} {} {:g} texto {:g}".format(dim_style["name"], style["name"], mark, mark_size, text_height)
+    if horizontal_text:
+        name += " vertical"
+    settings = [
+        (rs.DimStyleExtension, dim_style["extension"]),
+        (rs.DimStyleOffset, dim_style["offset"]),
+        (rs.DimStyleTextGap, dim_style["text_gap"]),
+        (rs.DimStyleTextHeight, text_height),
+        (rs.DimStyleFont, style["font"]),
+        (rs.DimStyleTextAlignment, DIM_TEXT_HORIZONTAL if horizontal_text else DIM_TEXT_ABOVE),
+        (rs.DimStyleArrowSize, arrow_size),
+    ]
+    return name, settings
+
+def brand_dim_style(style, dim_style, horizontal_text):
+    # Crea el estilo la primera vez y lo actualiza si el estilo Base o el perfil cambiaron
+    name, settings = dim_style_settings(style, dim_style, horizontal_text)
+    created = name not in (rs.DimStyleNames() or [])
+    if created:
+        rs.AddDimStyle(name)
+    changed = [(function, value) for function, value in settings if function(name) != value]
+    for function, value in changed:
+        function(name, value)
+    if created or changed:
+        configure_arrowheads(name, style)
+    return name
+
+def add_live_dimension(start_pt, end_pt, location_pt, axis, style, dim_style):
+    axis = upright_axis(axis)
+    normal = geo.perpendicular(axis)
+    horizontal_text = abs(axis[1]) > abs(axis[0])
+
+    plane = rs.PlaneFromFrame(start_pt, axis, normal)
+    dim = rs.AddLinearDimension(plane, start_pt, end_pt, location_pt)
+    if not dim:
+        raise Exception("No se pudo crear la cota")
+    try:
+        rs.DimensionStyle(dim, brand_dim_style(style, dim_style, horizontal_text))
+        rs.DimensionUserText(dim, format_dimension_text(rs.DimensionValue(dim)))
+        cotas_objetos.modify_attributes([dim], style["layer_color"], style["print_width"])
+    except Exception:
+        rs.DeleteObject(dim)
+        raise
+    return [dim]
+
+def add_dimension_in_cm_and_inches(start_pt, end_pt, location_pt, axis, style, dim_style, groups=None):
+    if dim_style["live"]:
+        return add_live_dimension(start_pt, end_pt, location_pt, axis, style, dim_style)
+    return add_dimension(start_pt, end_pt, location_pt, axis, style, dim_style, groups)
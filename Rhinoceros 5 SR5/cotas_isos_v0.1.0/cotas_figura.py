@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Figura humana de referencia como bloque. El primer clic de cada marca lee de
+# referencia_dim_hombre-objeto.3dm solo las capas y los objetos de la figura y con ellos
+# define el bloque "Figura-Humana <marca>" sobre las capas de la marca; los siguientes
+# solo insertan una instancia. La descripción del bloque guarda la ruta y la fecha de
+# modificación del archivo: si el archivo cambia, el bloque se redefine y se actualizan
+# también las figuras ya colocadas.
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import os
+import Rhino
+import cotas_objetos
+
+FILE_NAME = "referencia_dim_hombre-objeto.3dm"
+
+# Capa principal de la figura y sus subcapas, tal como vienen en el archivo
+MAIN_LAYER = "Figura-Humana"
+LINE_LAYER = "Figura-Humana_linea"
+TEXT_LAYER = "Figura-Humana_cota"
+EXPECTED_LAYERS = [MAIN_LAYER, LINE_LAYER, TEXT_LAYER]
+
+def file_path():
+    return os.path.join(os.path.dirname(__file__), FILE_NAME)
+
+def source_key(path):
+    # None si el archivo no está (borrado o movido)
+    if not os.path.isfile(path):
+        return None
+    try:
+        return "{}|{}".format(path, int(os.path.getmtime(path)))
+    except OSError:
+        return None
+
+def block_name(style):
+    return MAIN_LAYER + " " + style["name"]
+
+def brand_layer(style, layer_name):
+    # Figura-Humana -> Figura-Humana <marca>; las subcapas cuelgan de ella
+    main_layer = block_name(style)
+    if layer_name == MAIN_LAYER:
+        return main_layer
+    return main_layer + "::" + layer_name
+
+def add_brand_layers(style):
+    main_layer = block_name(style)
+    if not rs.IsLayer(main_layer):
+        rs.AddLayer(main_layer)
+    for layer_name in (LINE_LAYER, TEXT_LAYER):
+        full_path = brand_layer(style, layer_name)
+        if not rs.IsLayer(full_path):
+            rs.AddLayer(layer_name, parent=main_layer)
+        # La línea y la cota de la figura llevan el color de la marca
+        rs.LayerColor(full_path, style["layer_color"])
+
+def delete_imported_layers():
+    # Las capas que trajo la importación se quedan vacías al pasar la figura a la marca
+    for layer_name in (LINE_LAYER, TEXT_LAYER):
+        full_path = MAIN_LAYER + "::" + layer_name
+        if rs.IsLayer(full_path) and rs.IsLayerEmpty(full_path):
+            rs.DeleteLayer(full_path)
+    if rs.IsLayer(MAIN_LAYER) and rs.IsLayerEmpty(MAIN_LAYER) and not rs.LayerChildCount(MAIN_LAYER):
+        rs.DeleteLayer(MAIN_LAYER)
+
+def read_figure(path):
+    # [(capa, geometría, atributos)] de la figura sin pasar por _-Import: ni estilos, ni
+    # ajustes, ni capas ajenas del archivo. None si RhinoCommon no puede leerlo.
+    tables = Rhino.FileIO.File3dm.TableTypeFilter
+    model = Rhino.FileIO.File3dm.Read(path, tables.Layer | tables.ObjectTable,
+                                      Rhino.FileIO.File3dm.ObjectTypeFilter.Any)
+    if model is None:
+        return None
+    parts = []
+    for file_object in model.Objects:
+        layer_name = model.Layers[file_object.Attributes.LayerIndex].Name
+        if layer_name in EXPECTED_LAYERS:
+            parts.append((layer_name, file_object.Geometry, file_object.Attributes))
+    return parts
+
+def import_figure(path):
+    # Lo mismo con _-Import, para archivos que File3dm no lee. Solo se revisan los objetos
+    # que creó la importación, sin buscar su grupo entre todos los del documento, y se
+    # borran con su grupo en cuanto pasan al bloque.
+    rs.Command('_-Import "{}" _Enter'.format(path))
+    imported = rs.LastCreatedObjects() or []
+    print("Archivo importado:", path)
+    if not imported:
+        return None
+
+    parts = []
+    groups = set()
+    for obj in imported:
+        rhino_object = sc.doc.Objects.Find(obj)
+        attrs = rhino_object.Attributes
+        layer_name = sc.doc.Layers[attrs.LayerIndex].Name
+        if layer_name in EXPECTED_LAYERS:
+            parts.append((layer_name, rhino_object.Geometry.Duplicate(), attrs))
+        groups.update(rs.ObjectGroups(obj) or [])
+    rs.DeleteObjects(imported)
+    for group_name in groups:
+        rs.DeleteGroup(group_name)
+    delete_imported_layers()
+    return parts
+
+def block_geometry(parts, style):
+    # Cada objeto en la capa de la marca que le corresponde y los textos con su tipografía
+    add_brand_layers(style)
+    font_index = sc.doc.Fonts.FindOrCreate(style["font"], False, False)
+    geometry = []
+    attributes = []
+    for layer_name, part, file_attributes in parts:
+        attrs = cotas_objetos.attributes(layer=brand_layer(style, layer_name))
+        attrs.Name = file_attributes.Name
+        if isinstance(part, Rhino.Geometry.TextEntity):
+            part.FontIndex = font_index
+        geometry.append(part)
+        attributes.append(attrs)
+    return geometry, attributes
+
+def define_block(name, parts, style, key):
+    geometry, attributes = block_geometry(parts, style)
+    definition = sc.doc.InstanceDefinitions.Find(name, True)
+    if definition is None:
+        index = sc.doc.InstanceDefinitions.Add(name, key, Rhino.Geometry.Point3d(0, 0, 0), geometry, attributes)
+        return name if index >= 0 else None
+    # Archivo modificado: nueva geometría para el mismo bloque y sus instancias
+    sc.doc.InstanceDefinitions.ModifyGeometry(definition.Index, geometry, attributes)
+    sc.doc.InstanceDefinitions.Modify(definition.Index, name, key, True)
+    return name
+
+def figure_block(style):
+    # Nombre del bloque de la figura de la marca, leyendo el archivo solo si hace falta
+    path = file_path()
+    key = source_key(path)
+    if key is None:
+        print("No se encontró la figura en", path)
+        return None
+    name = block_name(style)
+    definition = sc.doc.InstanceDefinitions.Find(name, True)
+    if definition is not None and definition.Description == key:
+        return name
+    parts = read_figure(path)
+    if parts is None:
+        parts = import_figure(path)
+    if not parts:
+        print("No se encontró la figura en", path)
+        return None
+    return define_block(name, parts, style, key)
+
+def insert_figure(style):
+    name = figure_block(style)
+    if name is None:
+        return None
+    # Donde está en el archivo: el bloque tiene su origen en el del archivo
+    return rs.InsertBlock(name, (0, 0, 0))
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+# Geometría sin rhinoscriptsyntax: se puede ejecutar y medir en CPython.
+# Los puntos y vectores son tuplas (x, y, z); las funciones en plural trabajan
+# sobre listas y usan NumPy cuando está disponible. NumPy se busca la primera vez que
+# hace falta y no al importar el módulo: en IronPython no existe y en CPython es lento.
+import itertools
+import math
+
+# Sin buscar todavía; None si no está instalado
+_np = False
+
+_templates = {}
+
+def _numpy():
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+def z_of(point):
+    # Admite tuplas 2D, tuplas 3D y Point3d de Rhino
+    try:
+        return float(point[2])
+    except IndexError:
+        return 0.0
+
+def point3d(point):
+    return (float(point[0]), float(point[1]), z_of(point))
+
+def add(a, b):
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+def subtract(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+def reverse(vector):
+    return (-vector[0], -vector[1], -vector[2])
+
+def dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+def length(vector):
+    return math.sqrt(vector[0] * vector[0] + vector[1] * vector[1] + vector[2] * vector[2])
+
+def distance(a, b):
+    return length(subtract(b, a))
+
+def unitize(vector):
+    vector_length = length(vector)
+    if vector_length == 0:
+        return None
+    return (vector[0] / vector_length, vector[1] / vector_length, vector[2] / vector_length)
+
+def perpendicular(vector):
+    # Giro de 90° en Z sin trigonometría
+    return (-vector[1], vector[0], vector[2])
+
+def offset_point(point, direction, offset_distance):
+    return (point[0] + direction[0] * offset_distance,
+            point[1] + direction[1] * offset_distance,
+            point[2] + direction[2] * offset_distance)
+
+def midpoint(a, b):
+    return ((a[0] + b[0]) * 0.5, (a[1] + b[1]) * 0.5, (a[2] + b[2]) * 0.5)
+
+def midpoints(start_points, end_points):
+    np = _numpy()
+    if np is not None:
+        starts = np.asarray(start_points, dtype=float).reshape(-1, 3)
+        ends = np.asarray(end_points, dtype=float).reshape(-1, 3)
+        return [tuple(pt) for pt in ((starts + ends) * 0.5).tolist()]
+    return [midpoint(a, b) for a, b in zip(start_points, end_points)]
+
+# Ejes isométricos en planta, en grados entre 0 y 180: vertical y las dos diagonales
+ISO_VERTICAL = 90.0
+ISO_AXES = (30.0, ISO_VERTICAL, 150.0)
+
+def iso_axis(angle_degrees, tolerance_degrees=1.0):
+    # Eje de ISO_AXES al que pertenece una dirección (en cualquier sentido), o None
+    angle = angle_degrees % 180.0
+    for axis in ISO_AXES:
+        if abs((angle - axis + 90.0) % 180.0 - 90.0) <= tolerance_degrees:
+            return axis
+    return None
+
+def classify_iso_axes(start_points, end_points, tolerance_degrees=1.0):
+    # Eje isométrico de cada tramo (None para "otro" y para tramos sin longitud en XY)
+    np = _numpy()
+    if np is not None:
+        starts = np.asarray(start_points, dtype=float).reshape(-1, 3)
+        ends = np.asarray(end_points, dtype=float).reshape(-1, 3)
+        dx = ends[:, 0] - starts[:, 0]
+        dy = ends[:, 1] - starts[:, 1]
+        angles = np.degrees(np.arctan2(dy, dx)) % 180.0
+        axes = np.asarray(ISO_AXES)
+        deviation = np.abs((angles[:, None] - axes[None, :] + 90.0) % 180.0 - 90.0)
+        nearest = deviation.argmin(axis=1)
+        valid = (deviation[np.arange(len(angles)), nearest] <= tolerance_degrees) & ((dx != 0) | (dy != 0))
+        return [ISO_AXES[index] if ok else None for index, ok in zip(nearest.tolist(), valid.tolist())]
+    result = []
+    for start, end in zip(start_points, end_points):
+        dx, dy = end[0] - start[0], end[1] - start[1]
+        if dx == 0 and dy == 0:
+            result.append(None)
+        else:
+            result.append(iso_axis(math.degrees(math.atan2(dy, dx)), tolerance_degrees))
+    return result
+
+def distance_matrix(points_a, points_b):
+    # distancias[i][j] en XY entre points_a[i] y points_b[j]
+    np = _numpy()
+    if np is not None:
+        a = np.asarray([point3d(pt) for pt in points_a], dtype=float).reshape(-1, 3)
+        b = np.asarray([point3d(pt) for pt in points_b], dtype=float).reshape(-1, 3)
+        return np.hypot(a[:, None, 0] - b[None, :, 0], a[:, None, 1] - b[None, :, 1]).tolist()
+    return [[math.hypot(a[0] - b[0], a[1] - b[1]) for b in points_b] for a in points_a]
+
+# Más combinaciones que esto y assignment() pasa a ir por el par más cercano
+EXACT_ASSIGNMENT_LIMIT = 5040
+
+def assignment(distances):
+    # Columna asignada a cada fila de distances (None si no quedan columnas) con la menor
+    # suma de distancias. Con muchas combinaciones, por pares de menor distancia.
+    rows = len(distances)
+    columns = len(distances[0]) if rows else 0
+    combinations = 1
+    for k in range(min(rows, columns)):
+        combinations *= columns - k
+    if combinations <= EXACT_ASSIGNMENT_LIMIT:
+        if rows <= columns:
+            best = min(itertools.permutations(range(columns), rows),
+                       key=lambda chosen: sum(distances[i][j] for i, j in enumerate(chosen)))
+            return list(best)
+        best = min(itertools.permutations(range(rows), columns),
+                   key=lambda chosen: sum(distances[i][j] for j, i in enumerate(chosen)))
+        result = [None] * rows
+        for j, i in enumerate(best):
+            result[i] = j
+        return result
+
+    result = [None] * rows
+    used = set()
+    pairs = sorted((distances[i][j], i, j) for i in range(rows) for j in range(columns))
+    for value, i, j in pairs:
+        if result[i] is None and j not in used:
+            result[i] = j
+            used.add(j)
+    return result
+
+def arrow_template(arrow_width):
+    # Punta en el origen apuntando a +X, lados a ±150° como en add_arrow()
+    x = arrow_width * math.cos(math.radians(150))
+    y = arrow_width * math.sin(math.radians(150))
+    return ((0.0, 0.0), (x, y), (x, -y), (0.0, 0.0))
+
+def tick_template(tick_length):
+    # Línea sobre el eje Y centrada en el origen, como add_perpendicular_line()
+    return ((0.0, -float(tick_length)), (0.0, float(tick_length)))
+
+def mark_template(style):
+    if style.get("tick_length"):
+        key = ("tick", style["tick_length"])
+    else:
+        key = ("arrow", style["arrow_width"])
+    template = _templates.get(key)
+    if template is None:
+        if key[0] == "tick":
+            template = tick_template(key[1])
+        else:
+            template = arrow_template(key[1])
+        _templates[key] = template
+    return template
+
+def direction_frame(vector):
+    # Coseno y seno del ángulo del vector en XY, sin trigonometría
+    vector_length = math.hypot(vector[0], vector[1])
+    if vector_length == 0:
+        return 1.0, 0.0
+    return vector[0] / vector_length, vector[1] / vector_length
+
+def perpendicular_frame(vector):
+    # Gira la plantilla para que su eje Y quede sobre el vector
+    cos_a, sin_a = direction_frame(vector)
+    return sin_a, -cos_a
+
+def frame_transform(point, frame):
+    # Matriz 4x4 de rotación en Z + traslación, apta para rs.InsertBlock2
+    cos_a, sin_a = frame
+    return [[cos_a, -sin_a, 0.0, float(point[0])],
+            [sin_a, cos_a, 0.0, float(point[1])],
+            [0.0, 0.0, 1.0, z_of(point)],
+            [0.0, 0.0, 0.0, 1.0]]
+
+def dimension_frame(start_pt, end_pt):
+    # Marcos de las marcas inicial y final de una cota: el final sigue la línea y el
+    # inicial es el mismo invertido
+    cos_a, sin_a = direction_frame((end_pt[0] - start_pt[0], end_pt[1] - start_pt[1]))
+    return (-cos_a, -sin_a), (cos_a, sin_a)
+
+def offset_side(points, direction_point):
+    # 1 si direction_point queda a la izquierda del primer tramo (o sobre su recta), -1 si no
+    first = subtract(points[1], points[0])
+    side = first[0] * (direction_point[1] - points[0][1]) - first[1] * (direction_point[0] - points[0][0])
+    return -1.0 if side < 0 else 1.0
+
+def offset_sign(points, direction_point):
+    return 1.0 if direction_point is None else offset_side(points, direction_point)
+
+# Una esquina más lejos de su vértice que esto por la distancia de desfase (tramos casi
+# paralelos o que vuelven sobre sí mismos) no se dibuja: el desfase queda para rs.OffsetCurve
+MITER_LIMIT = 4.0
+
+def segment_corner(previous_start, previous_end, start, end):
+    # Intersección en XY de las rectas de dos tramos desfasados y su parámetro sobre el
+    # primero (0 en su inicio, 1 en su fin); None si son paralelas
+    d1x, d1y = previous_end[0] - previous_start[0], previous_end[1] - previous_start[1]
+    d2x, d2y = end[0] - start[0], end[1] - start[1]
+    denominator = d1x * d2y - d1y * d2x
+    if abs(denominator) < 1e-12:
+        return None
+    t = ((start[0] - previous_start[0]) * d2y - (start[1] - previous_start[1]) * d2x) / denominator
+    return (previous_start[0] + d1x * t, previous_start[1] + d1y * t, previous_end[2]), t
+
+def offset_polyline(points, offset_distance, direction_point=(0, 0, 0)):
+    # Desfase en XY de una polilínea de tramos rectos. El lado lo decide solo el primer
+    # tramo: todos se desfasan hacia el lado en que direction_point queda respecto a él.
+    # Cada tramo desfasado deja sus dos vértices y la esquina entre tramos: tramo i =
+    # vértices (3i, 3i+1). En una esquina exterior los tramos se alargan hasta cortarse; en
+    # una interior se recortan en el corte, que queda repetido. None si un tramo desaparece
+    # al recortarlo (desfase mayor que el tramo) o una esquina pasa de MITER_LIMIT: eso,
+    # como las curvas con arcos, queda para rs.OffsetCurve.
+    return offset_polylines([points], [offset_distance], direction_point)[0]
+
+def offset_polylines(polylines, distances, direction_point=(0, 0, 0)):
+    # Con direction_point None el lado lo da el signo de cada distancia: positiva a la
+    # izquierda del primer tramo. Las dos versiones siguen la misma regla: todas las
+    # esquinas se calculan con los tramos sin recortar, luego se recortan las interiores y
+    # se descarta la polilínea si algún tramo queda del revés o una esquina se va lejos.
+    polylines = [[point3d(pt) for pt in points] for points in polylines]
+    if _numpy() is not None:
+        return _offset_polylines_numpy(polylines, distances, direction_point)
+    result = []
+    for points, offset_distance in zip(polylines, distances):
+        shift = offset_sign(points, direction_point) * offset_distance
+        segments = []
+        for start, end in zip(points[:-1], points[1:]):
+            cos_a, sin_a = direction_frame(subtract(end, start))
+            segments.append([(start[0] - sin_a * shift, start[1] + cos_a * shift, start[2]),
+                             (end[0] - sin_a * shift, end[1] + cos_a * shift, end[2])])
+        directions = [(end[0] - start[0], end[1] - start[1]) for start, end in zip(points[:-1], points[1:])]
+        corners = []
+        for previous, current in zip(segments[:-1], segments[1:]):
+            corner = segment_corner(previous[0], previous[1], current[0], current[1])
+            corners.append(corner if corner is not None else (previous[1], 1.0))
+        failed = False
+        for k, (point, t) in enumerate(corners):
+            vertex = points[k + 1]
+            if math.hypot(point[0] - vertex[0], point[1] - vertex[1]) > MITER_LIMIT * abs(offset_distance):
+                failed = True
+            if t < 1.0:
+                # Esquina interior: los dos tramos se cortan antes de su fin y se recortan ahí
+                segments[k][1] = point
+                segments[k + 1][0] = point
+        for (start, end), direction in zip(segments, directions):
+            if (direction[0] or direction[1]) and \
+                    (end[0] - start[0]) * direction[0] + (end[1] - start[1]) * direction[1] <= 0:
+                failed = True
+        if failed:
+            result.append(None)
+            continue
+        vertices = list(segments[0])
+        for (point, t), current in zip(corners, segments[1:]):
+            vertices.append(point)
+            vertices.extend(current)
+        result.append(vertices)
+    return result
+
+def _offset_polylines_numpy(polylines, distances, direction_point):
+    # Todos los tramos de todas las polilíneas en una pasada; solo el montaje final es por polilínea
+    np = _numpy()
+    counts = [len(points) - 1 for points in polylines]
+    shifts = [offset_sign(points, direction_point) * offset_distance
+              for points, offset_distance in zip(polylines, distances)]
+    starts = np.asarray([pt for points in polylines for pt in points[:-1]], dtype=float).reshape(-1, 3)
+    ends = np.asarray([pt for points in polylines for pt in points[1:]], dtype=float).reshape(-1, 3)
+    vertices_in = ends[:-1].copy()
+
+    delta = ends[:, :2] - starts[:, :2]
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    degenerate = length == 0
+    length[degenerate] = 1.0
+    cos_a = np.where(degenerate, 1.0, delta[:, 0] / length)
+    sin_a = np.where(degenerate, 0.0, delta[:, 1] / length)
+    shift = np.repeat(np.asarray(shifts, dtype=float), counts)
+    starts[:, 0] -= sin_a * shift
+    starts[:, 1] += cos_a * shift
+    ends[:, 0] -= sin_a * shift
+    ends[:, 1] += cos_a * shift
+
+    # Esquina entre cada tramo y el siguiente, con los tramos sin recortar; la del último
+    # tramo de cada polilínea no se usa
+    d1 = ends[:-1, :2] - starts[:-1, :2]
+    d2 = ends[1:, :2] - starts[1:, :2]
+    denominator = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    parallel = np.abs(denominator) < 1e-12
+    denominator[parallel] = 1.0
+    t = ((starts[1:, 0] - starts[:-1, 0]) * d2[:, 1] - (starts[1:, 1] - starts[:-1, 1]) * d2[:, 0]) / denominator
+    t[parallel] = 1.0
+    corners = ends[:-1].copy()
+    corners[:, 0] = np.where(parallel, ends[:-1, 0], starts[:-1, 0] + d1[:, 0] * t)
+    corners[:, 1] = np.where(parallel, ends[:-1, 1], starts[:-1, 1] + d1[:, 1] * t)
+
+    last = np.cumsum(counts) - 1
+    used = np.ones(len(corners), dtype=bool)
+    used[last[:-1]] = False
+    polyline_of = np.repeat(np.arange(len(counts)), counts)
+    limits = MITER_LIMIT * np.abs(np.repeat(np.asarray(distances, dtype=float), counts))
+    far = used & (np.hypot(corners[:, 0] - vertices_in[:, 0], corners[:, 1] - vertices_in[:, 1]) > limits[:-1])
+
+    # Esquinas interiores: los dos tramos se recortan en el corte
+    inner = used & (t < 1.0)
+    ends[:-1][inner] = corners[inner]
+    starts[1:][inner] = corners[inner]
+    # Un tramo que se queda del revés ha desaparecido en el recorte
+    collapsed = ((ends[:, 0] - starts[:, 0]) * delta[:, 0] + (ends[:, 1] - starts[:, 1]) * delta[:, 1] <= 0) & ~degenerate
+    failed = set(polyline_of[collapsed].tolist()) | set(polyline_of[:-1][far].tolist())
+
+    # Filas inicio, fin, esquina por tramo, sin la esquina del último tramo de cada polilínea
+    rows = np.empty((len(starts), 3, 3))
+    rows[:, 0] = starts
+    rows[:, 1] = ends
+    rows[:-1, 2] = corners
+    keep = np.ones(len(starts) * 3, dtype=bool)
+    keep[np.cumsum(counts) * 3 - 1] = False
+    vertices = [tuple(pt) for pt in rows.reshape(-1, 3)[keep].tolist()]
+
+    result = []
+    first = 0
+    for index, count in enumerate(counts):
+        result.append(None if index in failed else vertices[first:first + 3 * count - 1])
+        first += 3 * count - 1
+    return result
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import cotas_capas
+import cotas_constructor
+import cotas_geometria as geo
+import cotas_objetos
+import cotas_transaccion
+
+def get_point_pairs():
+    point_pairs = []
+    while True:
+        punto1 = rs.GetPoint("Primer punto de la cota {} (Enter para terminar)".format(len(point_pairs) + 1))
+        if not punto1:
+            break
+        punto2 = rs.GetPoint("Segundo punto de la cota {}".format(len(point_pairs) + 1), punto1)
+        if not punto2:
+            break
+        point_pairs.append((punto1, punto2))
+    return point_pairs
+
+def get_curve_point_pairs(curves):
+    point_pairs = []
+    tolerance = rs.UnitAbsoluteTolerance()
+    for curve in curves:
+        start_pt = geo.point3d(rs.CurveStartPoint(curve))
+        end_pt = geo.point3d(rs.CurveEndPoint(curve))
+        if geo.distance(start_pt, end_pt) > tolerance:
+            point_pairs.append((start_pt, end_pt))
+    return point_pairs
+
+def dimension_location(start_pt, end_pt, offset_distance):
+    # Horizontal o vertical según la dirección dominante; la línea va por encima o a la izquierda
+    if abs(end_pt[0] - start_pt[0]) >= abs(end_pt[1] - start_pt[1]):
+        location_pt = (start_pt[0], max(start_pt[1], end_pt[1]) + offset_distance, start_pt[2])
+        return location_pt, (1, 0, 0)
+    location_pt = (min(start_pt[0], end_pt[0]) - offset_distance, start_pt[1], start_pt[2])
+    return location_pt, (0, 1, 0)
+
+def add_linear_dimensions_in_cm_and_inches_batch(style):
+    # style: perfil de la cota lineal de la marca, ver cotas_motor.profile
+    base_layer_name = style["layer"]
+    layer_color = style["layer_color"]
+    print_width = style["print_width"]
+    current_layer = rs.CurrentLayer()
+
+    curves = rs.GetObjects("Seleccione las curvas a acotar (Enter para indicar pares de puntos)", rs.filter.curve, preselect=True)
+    if curves:
+        point_pairs = get_curve_point_pairs(curves)
+    else:
+        point_pairs = get_point_pairs()
+    if not point_pairs:
+        return
+
+    offset_distance = rs.GetReal("Distancia de la línea de cota a los puntos", 0.0)
+    if offset_distance is None:
+        return
+
+    # Una sola transacción para todo el lote: un paso de deshacer, un redibujado y, con Esc
+    # o un error, ninguna cota a medias
+    transaction = cotas_transaccion.Transaction("Cotas lineales en lote")
+    transaction.begin()
+    completed = False
+    try:
+        dim_style = cotas_constructor.read_dim_style("Base")
+
+        cotas_capas.set_layer_properties(base_layer_name, layer_color, print_width,
+                                         update_color=style.get("update_layer_color", False))
+
+        # Todo el lote comparte subcapa; en modo capa de marca cada cota lleva su propio ID
+        cota_layer_name = cotas_capas.add_cota_layer(base_layer_name, layer_color, print_width)[1]
+        rs.CurrentLayer(cota_layer_name)
+
+        # Los grupos de todas las cotas se crean juntos al final
+        groups = []
+        for start_pt, end_pt in point_pairs:
+            sc.escape_test()
+            location_pt, axis = dimension_location(start_pt, end_pt, offset_distance)
+            cota_id = cotas_capas.new_cota_id()
+            cotas_capas.begin_cota(cota_id, layer_color, print_width)
+            dimension_objects = cotas_constructor.add_dimension_in_cm_and_inches(
+                start_pt, end_pt, location_pt, axis, style, dim_style, groups)
+            cotas_capas.tag_cota(dimension_objects, cota_id, layer_color, print_width, groups)
+        cotas_objetos.add_groups(groups)
+
+        print("Cotas creadas: {}".format(len(point_pairs)))
+        completed = True
+
+    except Exception as e:
+        print("Error: ", str(e))
+    finally:
+        rs.CurrentLayer(current_layer)
+        rs.UnselectAllObjects()
+        cotas_capas.purge_tracked_sublayers(base_layer_name)
+        transaction.end(completed)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Perfiles de marca. Cada marca define su capa, color y tipografía, y cada tipo de cota
+# solo lo que cambia: grosor de impresión, altura del texto y flecha (arrow_width) o
+# tick (tick_length). Las claves son las del diccionario style de cotas_constructor
+# y cotas_bloques; una marca nueva es una entrada más aquí y un botón por tipo de cota.
+
+# Sección de los datos del documento (rs.GetDocumentData) donde guardan sus modos
+# cotas_constructor, cotas_capas y cotas_textos
+DOCUMENT_SECTION = "cotas_isos"
+
+BRANDS = {
+    "basica": {
+        "name": "BÁSICO",
+        "layer": "Cotas BÁSICO",
+        "layer_color": (255, 5, 5),
+        "font": "LibelSuitRg-Regular",
+        # La capa vuelve al color de la marca aunque se haya cambiado a mano
+        "update_layer_color": True,
+        "kinds": {
+            "lineal": {"print_width": 1.10, "arrow_width": 15},
+            "alineada": {"print_width": 2.00, "text_height": 40},
+            "externa": {"print_width": 2.0, "text_height": 40.0},
+            "hombre-objeto": {},
+        },
+    },
+    "depot": {
+        "name": "DEPOT",
+        "layer": "Cotas DEPOT",
+        "layer_color": (0, 0, 0),
+        "font": "Kanit-Regular",
+        "kinds": {
+            "lineal": {"print_width": 1.10, "arrow_width": 10},
+            "interna": {"print_width": 1.10, "arrow_width": 10, "text_height": 35, "colored_text": True},
+            "externa": {"print_width": 2.0, "text_height": 35},
+            "hombre-objeto": {},
+        },
+    },
+    "fm-furniture": {
+        "name": "FM",
+        "layer": "Cotas FM",
+        "layer_color": (237, 118, 32),
+        "font": "Bahnschrift",
+        "kinds": {
+            "lineal": {"print_width": 1.10, "text_height": 30, "tick_length": 20},
+            "interna": {"print_width": 1.10, "text_height": 30, "tick_length": 20},
+            "externa": {"print_width": 2.0, "text_height": 40.0},
+            "hombre-objeto": {},
+        },
+    },
+    "tu-home": {
+        "name": "TU-HOME",
+        "layer": "Cotas TU-HOME",
+        "layer_color": (0, 0, 0),
+        "font": "Myriad Pro",
+        "kinds": {
+            "lineal": {"print_width": 2.00, "text_height": 30, "tick_length": 20},
+            "interna": {"layer_color": (255, 5, 5), "print_width": 1.10, "text_height": 30, "tick_length": 20},
+            # La cota externa de TU-HOME se dibuja como la interna
+            "externa": {"builder": "interna", "print_width": 2.00, "text_height": 30, "tick_length": 20},
+            "hombre-objeto": {},
+        },
+    },
+    "we-have": {
+        "name": "WE-HAVE",
+        "layer": "Cotas WE-HAVE",
+        "layer_color": (231, 91, 103),
+        "font": "MADETommySoft-Light",
+        "kinds": {
+            "lineal": {"print_width": 1.10, "arrow_width": 10},
+            "interna": {"print_width": 1.10, "arrow_width": 10, "text_height": 35, "colored_text": True},
+            "externa": {"print_width": 2.0, "text_height": 35},
+            "hombre-objeto": {},
+        },
+    },
+}
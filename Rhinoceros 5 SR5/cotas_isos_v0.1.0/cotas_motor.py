@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# Un solo motor para todas las cotas: los botones llaman a run(marca, tipo) a través de
+# cotas_comandos y lo que cambia de una marca a otra sale de cotas_marcas. Los perfiles
+# ya resueltos quedan en _profiles para los clics siguientes.
+import rhinoscriptsyntax as rs
+import cotas_bloques
+import cotas_capas
+import cotas_constructor
+import cotas_geometria as geo
+import cotas_marcas
+import cotas_objetos
+import cotas_textos
+import cotas_transaccion
+
+# El lote usa el perfil de la cota lineal y las cajas el de la externa
+KIND_SECTIONS = {"lote": "lineal", "cajas": "externa"}
+
+_profiles = {}
+
+def profile(brand, kind):
+    key = (brand, kind)
+    if key not in _profiles:
+        brand_profile = cotas_marcas.BRANDS[brand]
+        style = dict((name, value) for name, value in brand_profile.items() if name != "kinds")
+        style.update(brand_profile["kinds"][KIND_SECTIONS.get(kind, kind)])
+        _profiles[key] = style
+    return _profiles[key]
+
+def linear_dimension(style, aligned=False):
+    base_layer_name = style["layer"]
+    layer_color = style["layer_color"]
+    print_width = style["print_width"]
+    current_layer = rs.CurrentLayer()
+    try:
+        cotas_capas.set_layer_properties(base_layer_name, layer_color, print_width,
+                                         update_color=style.get("update_layer_color", False))
+
+        cota_id, cota_layer_name = cotas_capas.add_cota_layer(base_layer_name, layer_color, print_width)
+        rs.CurrentLayer(cota_layer_name)
+
+        points = cotas_constructor.get_dimension_points()
+        if not points:
+            return False
+
+        start_pt, end_pt, location_pt = points
+        if aligned:
+            axis = cotas_constructor.aligned_axis(start_pt, end_pt)
+        else:
+            axis = cotas_constructor.linear_axis(start_pt, end_pt, location_pt)
+        cota_objects = cotas_constructor.add_dimension_in_cm_and_inches(
+            start_pt, end_pt, location_pt, axis, style, cotas_constructor.read_dim_style("Base"))
+        cotas_capas.tag_cota(cota_objects, cota_id, layer_color, print_width)
+        return True
+
+    except Exception as e:
+        # Lo creado hasta aquí lo deshace la transacción
+        print("Error: ", str(e))
+        return False
+    finally:
+        rs.CurrentLayer(current_layer)
+        cotas_capas.purge_tracked_sublayers(base_layer_name)
+
+def internal_dimension(style):
+    ask = cotas_transaccion.ask
+    layer_name = style["layer"]
+    layer_color = style["layer_color"]
+    print_width = style["print_width"]
+    cota_objects = []
+
+    try:
+        cotas_capas.set_layer_properties(layer_name, layer_color, print_width)
+
+        uuid_str, cota_layer_name = cotas_capas.add_cota_layer(layer_name, layer_color, print_width)
+        rs.CurrentLayer(cota_layer_name)
+
+        punto1 = ask(rs.GetPoint, "Seleccione el primer punto de referencia")
+        if not punto1: return
+
+        punto2 = ask(rs.GetPoint, "Seleccione el segundo punto de referencia", punto1)
+        if not punto2: return
+
+        linea = cotas_objetos.add_line(punto1, punto2)
+        cota_objects.append(linea)
+
+        desplazamiento = ask(rs.GetPoint, "Seleccione el punto de desplazamiento", punto2)
+        if not desplazamiento: return
+
+        deltaX = desplazamiento[0] - punto2[0]
+        deltaY = desplazamiento[1] - punto2[1]
+
+        punto1_desplazado = (punto1[0] + deltaX, punto1[1] + deltaY, punto1[2])
+        punto2_desplazado = (punto2[0] + deltaX, punto2[1] + deltaY, punto2[2])
+
+        rs.MoveObject(linea, (deltaX, deltaY, 0))
+
+        if style.get("tick_length"):
+            # Los ticks siguen la dirección del desplazamiento
+            direccion_tick = (deltaX, deltaY, 0) if (deltaX or deltaY) else (0, 1, 0)
+            cota_objects.extend([cotas_bloques.insert_tick(punto1_desplazado, direccion_tick, style),
+                                 cotas_bloques.insert_tick(punto2_desplazado, direccion_tick, style)])
+        else:
+            vector = geo.unitize(geo.subtract(punto2_desplazado, punto1_desplazado))
+            cota_objects.extend([cotas_bloques.insert_arrow(punto1_desplazado, geo.reverse(vector), style),
+                                 cotas_bloques.insert_arrow(punto2_desplazado, vector, style)])
+
+        cota_id = ask(rs.GetObject, "Seleccione una cota para copiar la dimensión", rs.filter.annotation)
+        if not cota_id: raise Exception("No se seleccionó ninguna cota.")
+
+        dimension_text = rs.DimensionText(cota_id)
+        midpoint = geo.midpoint(punto1_desplazado, punto2_desplazado)
+        text_color = layer_color if style.get("colored_text") else None
+        texto = cotas_objetos.add_text(dimension_text, midpoint, style["text_height"], style["font"],
+                                       attrs=cotas_objetos.attributes(color=text_color))
+        cota_objects.append(texto)
+
+        cotas_objetos.add_group(cota_objects)
+        cotas_capas.tag_cota(cota_objects, uuid_str, layer_color, print_width)
+        return True
+
+    except:
+        rs.Command("_Ortho _Off")
+        print("Script cancelado. Se eliminaron los objetos creados.")
+    finally:
+        rs.CurrentLayer(layer_name)
+        cotas_capas.purge_tracked_sublayers(layer_name)
+
+def get_specific_midpoints(vertices, line_count):
+    # Puntos medios de los tramos desfasados, todos de una vez. rs.OffsetCurve deja cada
+    # tramo entre sus dos vértices y añade la esquina entre tramos: tramo i = vértices
+    # (3i, 3i+1). Si el desfase vuelve sin esquinas, tramo i = vértices (i, i+1).
+    step = 3 if len(vertices) >= 3 * line_count - 1 else 1
+    return geo.midpoints(vertices[0:step * line_count:step], vertices[1:step * line_count + 1:step])
+
+def segment_labels(line_count, axes=None):
+    # Altura, profundidad (desde 3 tramos) y una anchura por módulo, en el orden de dibujo.
+    # Con los ejes isométricos de los tramos, la altura es el único tramo vertical esté
+    # donde esté, y los demás siguen el orden de dibujo.
+    if line_count == 2:
+        labels = ["Altura", "Anchura"]
+    elif line_count == 3:
+        labels = ["Altura", "Profundidad", "Anchura"]
+    else:
+        labels = ["Altura", "Profundidad"] + ["Anchura {}".format(i + 1) for i in range(line_count - 2)]
+    if not axes or list(axes).count(geo.ISO_VERTICAL) != 1:
+        return labels
+    others = iter(labels[1:])
+    return [labels[0] if axis == geo.ISO_VERTICAL else next(others) for axis in axes]
+
+def offset_external_polyline(polyline, points, offset_distance, line_color, print_width):
+    # (curvas, vértices) de la polilínea desfasada hacia el lado del origen respecto a su
+    # primer tramo, calculada aquí y creada ya con su color y grosor. rs.OffsetCurve queda
+    # para lo que no es una polilínea plana en XY o pierde algún tramo al desfasarla.
+    vertices = None
+    if rs.IsPolyline(polyline) and len(set(geo.z_of(pt) for pt in points)) == 1:
+        vertices = geo.offset_polyline(points, offset_distance, (0, 0, 0))
+    if vertices is not None:
+        offset_id = cotas_objetos.add_polyline(vertices, cotas_objetos.attributes(color=line_color,
+                                                                                 print_width=print_width))
+        return ([offset_id], vertices) if offset_id else (None, None)
+    offset_ids = rs.OffsetCurve(polyline, [0, 0, 0], offset_distance)
+    if not offset_ids:
+        return None, None
+    cotas_objetos.modify_attributes(offset_ids, line_color, print_width)
+    return offset_ids, rs.PolylineVertices(offset_ids[0])
+
+def external_dimension(style):
+    base_layer = style["layer"]
+    line_color = style["layer_color"]
+    print_width = style["print_width"]
+
+    ask = cotas_transaccion.ask
+
+    try:
+        # Crear capa principal y subcapa
+        cotas_capas.set_layer_properties(base_layer, line_color, print_width)
+        sublayer_name, cota_layer_name = cotas_capas.add_cota_layer(base_layer, line_color, print_width)
+        rs.CurrentLayer(cota_layer_name)
+
+        # Insertar la polilínea
+        rs.MessageBox("Por favor, dibuje una polilínea con 2 o más líneas que representan la altura, profundidad (opcional) y la anchura de cada módulo.")
+        ask(rs.Command, "_Polyline")
+        polyline = rs.LastCreatedObjects()
+        if not polyline or len(polyline) != 1:
+            rs.MessageBox("No se creó una polilínea válida. Terminando el script.", 0)
+            return
+
+        polyline = polyline[0]
+
+        # Obtener el número de segmentos en la polilínea
+        vertices = rs.PolylineVertices(polyline)
+        line_count = len(vertices) - 1
+
+        if line_count < 2:
+            rs.MessageBox("Debe crear una polilínea con 2 o más líneas. Terminando el script.", 0)
+            rs.DeleteObject(polyline)
+            return
+
+        # Definir la distancia de offset visualmente
+        base_point = ask(rs.GetPoint, "Seleccione el punto base para el offset")
+        offset_point = ask(rs.GetPoint, "Seleccione el punto de destino para el offset", base_point)
+        if not base_point or not offset_point:
+            rs.MessageBox("Debe seleccionar dos puntos para definir la distancia de offset.", 0)
+            return
+
+        offset_distance = geo.distance(geo.point3d(base_point), geo.point3d(offset_point))
+        offset_polyline, offset_vertices = offset_external_polyline(polyline, vertices, offset_distance,
+                                                                    line_color, print_width)
+        if not offset_polyline:
+            rs.MessageBox("No se pudo desfasar la polilínea. Terminando el script.", 0)
+            return
+
+        # Obtener los puntos medios específicos
+        midpoints = get_specific_midpoints(offset_vertices, line_count)
+        created_objects = list(offset_polyline)
+
+        # Solicitar textos de referencia y asignar el texto centrado en los puntos medios
+        labels = segment_labels(line_count, geo.classify_iso_axes(vertices[:-1], vertices[1:]))
+        for text_content, point in zip(cotas_textos.reference_texts(labels, midpoints), midpoints):
+            if text_content is None:
+                continue
+            text = cotas_objetos.add_text(text_content, point, style["text_height"], style["font"],
+                                          attrs=cotas_objetos.attributes(color=line_color))
+            if text:
+                created_objects.append(text)
+
+        # Eliminar la polilínea original
+        rs.DeleteObject(polyline)
+
+        # Agrupar los objetos creados
+        cotas_objetos.add_group(created_objects)
+        cotas_capas.tag_cota(created_objects, sublayer_name, line_color, print_width)
+        return True
+
+    except Exception as e:
+        rs.MessageBox("Ocurrió un error: " + str(e), 0)
+
+    finally:
+        # Volver a activar la capa madre y purgar capas vacías
+        rs.CurrentLayer(base_layer)
+        cotas_capas.purge_tracked_sublayers(base_layer)
+
+def human_figure(style):
+    # Solo el primer clic de cada marca importa el archivo; los demás insertan el bloque
+    import cotas_figura
+    return cotas_figura.insert_figure(style) is not None
+
+# Tipo de cota: (función, descripción del paso de deshacer)
+BUILDERS = {
+    "lineal": (linear_dimension, "Cota lineal"),
+    "alineada": (lambda style: linear_dimension(style, aligned=True), "Cota alineada"),
+    "interna": (internal_dimension, "Cota isométrica interna"),
+    "externa": (external_dimension, "Cota isométrica externa"),
+    "hombre-objeto": (human_figure, "Figura humana"),
+}
+
+def run(brand, kind):
+    style = profile(brand, kind)
+    if kind == "lote":
+        # El lote abre su propia transacción
+        import cotas_lote
+        return cotas_lote.add_linear_dimensions_in_cm_and_inches_batch(style)
+    if kind == "cajas":
+        # Igual que el lote, una transacción para todas las cajas
+        import cotas_cajas
+        return cotas_cajas.add_box_dimensions(style)
+    function = BUILDERS[style.get("builder", kind)][0]
+    description = "{} {}".format(BUILDERS[kind][1], style["name"])
+    return cotas_transaccion.run(description, function, style)
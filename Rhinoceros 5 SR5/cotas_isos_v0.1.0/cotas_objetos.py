@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Objetos creados ya con sus atributos finales: una sola escritura por objeto en lugar
+# de rs.Add* seguido de rs.ObjectColor, rs.ObjectPrintWidth, rs.TextObjectFont...
+# Los grupos van directamente a la tabla de grupos, sin seleccionar ni usar _Group.
+# En modo capa de marca, attributes() añade además los de la cota en curso (color, grosor
+# e ID, ver cotas_capas.begin_cota) a todo lo que se crea hasta la siguiente cota.
+import scriptcontext as sc
+import Rhino
+import System
+import cotas_geometria as geo
+
+# Argumentos de _apply de la cota en curso; vacío fuera del modo capa de marca
+_cota_attributes = {}
+
+def _apply(attrs, color, print_width, layer, user_text):
+    if layer:
+        index = sc.doc.Layers.FindByFullPath(layer, True)
+        if index >= 0:
+            attrs.LayerIndex = index
+    if color is not None:
+        attrs.ObjectColor = System.Drawing.Color.FromArgb(*color)
+        attrs.ColorSource = Rhino.DocObjects.ObjectColorSource.ColorFromObject
+    if print_width is not None:
+        attrs.PlotWeight = print_width
+        attrs.PlotWeightSource = Rhino.DocObjects.ObjectPlotWeightSource.PlotWeightFromObject
+    for key, value in (user_text or {}).items():
+        attrs.SetUserString(key, value)
+    return attrs
+
+def attributes(color=None, print_width=None, layer=None, user_text=None):
+    # Sin argumentos son los de rs.Add*: capa actual, color y grosor por capa
+    attrs = _apply(sc.doc.CreateDefaultAttributes(), color, print_width, layer, user_text)
+    if _cota_attributes:
+        _apply(attrs, layer=None, **_cota_attributes)
+    return attrs
+
+def set_cota_attributes(color, print_width, user_text):
+    _cota_attributes.clear()
+    _cota_attributes.update(color=color, print_width=print_width, user_text=user_text)
+
+def clear_cota_attributes():
+    _cota_attributes.clear()
+
+def has_user_text(object_id, key, value):
+    rhino_object = sc.doc.Objects.Find(object_id)
+    return rhino_object is not None and rhino_object.Attributes.GetUserString(key) == value
+
+def _point(point):
+    x, y, z = geo.point3d(point)
+    return Rhino.Geometry.Point3d(x, y, z)
+
+def _result(object_id):
+    if object_id == System.Guid.Empty:
+        return None
+    return object_id
+
+def add_line(start, end, attrs=None):
+    return _result(sc.doc.Objects.AddLine(_point(start), _point(end), attrs or attributes()))
+
+def add_polyline(points, attrs=None):
+    # Sin vértices seguidos repetidos, como los de una esquina interior de geo.offset_polyline:
+    # Rhino no da por válida una polilínea con un tramo de longitud cero
+    points = [geo.point3d(pt) for pt in points]
+    points = points[:1] + [pt for previous, pt in zip(points[:-1], points[1:]) if pt != previous]
+    return _result(sc.doc.Objects.AddPolyline([_point(pt) for pt in points], attrs or attributes()))
+
+def add_text(text, point_or_plane, height=1.0, font="Arial", justification=None, attrs=None):
+    # Como rs.AddText: un punto se convierte en el plano de construcción de la vista activa
+    if isinstance(point_or_plane, Rhino.Geometry.Plane):
+        plane = point_or_plane
+    else:
+        plane = sc.doc.Views.ActiveView.ActiveViewport.ConstructionPlane()
+        plane.Origin = _point(point_or_plane)
+    justification = System.Enum.ToObject(Rhino.Geometry.TextJustification, justification or 0)
+    return _result(sc.doc.Objects.AddText(str(text), plane, height, font, False, False, justification,
+                                          attrs or attributes()))
+
+def _transform(xform):
+    transform = Rhino.Geometry.Transform(1.0)
+    for i, row in enumerate(xform):
+        for j, value in enumerate(row):
+            transform[i, j] = value
+    return transform
+
+def add_instance(definition_index, xform, attrs=None):
+    # Como rs.InsertBlock2 con una matriz 4x4 por filas, la de geo.frame_transform
+    return _result(sc.doc.Objects.AddInstanceObject(definition_index, _transform(xform), attrs or attributes()))
+
+def modify_attributes(object_ids, color=None, print_width=None, layer=None, user_text=None):
+    # Color, grosor, capa y texto de usuario de objetos ya creados, una escritura por objeto
+    for obj in object_ids:
+        rhino_object = sc.doc.Objects.Find(obj)
+        if rhino_object is None:
+            continue
+        attrs = _apply(rhino_object.Attributes.Duplicate(), color, print_width, layer, user_text)
+        sc.doc.Objects.ModifyAttributes(obj, attrs, True)
+
+def add_group(object_ids, group_name=None):
+    # Como rs.AddGroup(group_name) or rs.AddGroup() seguido de rs.AddObjectsToGroup
+    object_ids = [obj for obj in object_ids if obj]
+    if group_name and sc.doc.Groups.Find(group_name, True) >= 0:
+        group_name = None
+    if group_name:
+        index = sc.doc.Groups.Add(group_name, object_ids)
+    else:
+        index = sc.doc.Groups.Add(object_ids)
+    if index < 0:
+        return None
+    return sc.doc.Groups.GroupName(index)
+
+def name_group(object_ids, group_name):
+    # Da group_name al grupo que ya tiene alguno de los objetos y le añade los que faltan;
+    # si ninguno tiene grupo, o el nombre ya existe, es add_group
+    object_ids = [obj for obj in object_ids if obj]
+    group_lists = []
+    for obj in object_ids:
+        rhino_object = sc.doc.Objects.Find(obj)
+        group_list = rhino_object.Attributes.GetGroupList() if rhino_object is not None else None
+        group_lists.append(list(group_list or []))
+    indices = [group_list[0] for group_list in group_lists if group_list]
+    if not indices or sc.doc.Groups.Find(group_name, True) >= 0:
+        return add_group(object_ids, group_name)
+    index = indices[0]
+    sc.doc.Groups.ChangeGroupName(index, group_name)
+    missing = [obj for obj, group_list in zip(object_ids, group_lists) if index not in group_list]
+    if missing:
+        sc.doc.Groups.AddToGroup(index, missing)
+    return group_name
+
+def name_pending_group(groups, object_ids, group_name):
+    # Lo mismo sobre los grupos que add_groups creará al final de un lote
+    object_ids = [obj for obj in object_ids if obj]
+    members = set(object_ids)
+    for i in range(len(groups) - 1, -1, -1):
+        pending_name, grouped = groups[i]
+        if pending_name is None and members.intersection(grouped):
+            groups[i] = (group_name, list(grouped) + [obj for obj in object_ids if obj not in grouped])
+            return
+    groups.append((group_name, object_ids))
+
+def add_groups(groups):
+    # Grupos de un lote entero, [(nombre o None, objetos), ...], al terminar de crear sus objetos
+    return [add_group(object_ids, group_name) for group_name, object_ids in groups]
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Perfil de arranque. Con el modo activo cada clic olvida los módulos cotas_* como si
+# fuera el primero de la sesión, mide cuánto tarda cada importación y, al terminar el
+# comando, escribe lo que costó importar y compilar cada módulo y el script.
+import sys
+import time
+
+try:
+    import __builtin__ as builtins
+except ImportError:
+    import builtins
+
+MODULE_PREFIX = "cotas_"
+
+_clock = getattr(time, "perf_counter", None) or time.clock
+
+def _source_seconds(path):
+    # IronPython compila el .py en cada importación; se mide compilándolo otra vez aparte
+    if not path or not path.endswith(".py"):
+        return None
+    try:
+        with open(path, "rb") as source:
+            text = source.read()
+    except (IOError, OSError):
+        return None
+    start = _clock()
+    compile(text, path, "exec")
+    return _clock() - start
+
+class _Profile(object):
+    # Sustituye a __import__ mientras el modo está activo
+    def __init__(self, original):
+        self.original = original
+        self.stack = []
+        self.entries = []
+        self.script_path = None
+        self.seconds = 0.0
+
+    def forget_modules(self):
+        for name in list(sys.modules):
+            if name.startswith(MODULE_PREFIX) and name != __name__:
+                del sys.modules[name]
+
+    def __call__(self, name, *args, **kwargs):
+        caller = args[0] if args else kwargs.get("globals")
+        command = not self.stack and caller is not None and caller.get("__name__") == "__main__"
+        if command and name.startswith(MODULE_PREFIX):
+            self.forget_modules()
+            self.entries = []
+            self.script_path = caller.get("__file__")
+            self.seconds = 0.0
+        if name in sys.modules:
+            return self.original(name, *args, **kwargs)
+
+        # [nombre, segundos de las importaciones anidadas]
+        entry = [name, 0.0]
+        self.stack.append(entry)
+        start = _clock()
+        try:
+            return self.original(name, *args, **kwargs)
+        finally:
+            seconds = _clock() - start
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1][1] += seconds
+            else:
+                self.seconds += seconds
+            self.entries.append((name, seconds, seconds - entry[1]))
+
+    def report(self):
+        # Los comandos importan parte de sus módulos al ejecutarse, así que el informe
+        # espera al final del clic
+        if not self.entries:
+            return
+        print("Perfil de arranque de {}:".format(self.script_path or "script"))
+        script_seconds = _source_seconds(self.script_path)
+        if script_seconds is not None:
+            print("  compilar el script: {:.1f} ms".format(script_seconds * 1000.0))
+        compile_total = 0.0
+        for name, total, own in self.entries:
+            module = sys.modules.get(name)
+            compile_seconds = _source_seconds(getattr(module, "__file__", None))
+            line = "  {:<20} importar {:7.1f} ms (propio {:.1f} ms)".format(name, total * 1000.0, own * 1000.0)
+            if compile_seconds is not None:
+                compile_total += compile_seconds
+                line += ", compilar {:.1f} ms".format(compile_seconds * 1000.0)
+            print(line)
+        print("  Total: importar {:.1f} ms, de ellos compilar {:.1f} ms".format(self.seconds * 1000.0,
+                                                                             compile_total * 1000.0))
+        self.entries = []
+
+def profiling():
+    return isinstance(builtins.__import__, _Profile)
+
+def report():
+    if profiling():
+        builtins.__import__.report()
+
+def set_profiling(enabled):
+    if enabled and not profiling():
+        builtins.__import__ = _Profile(builtins.__import__)
+    elif not enabled and profiling():
+        builtins.__import__ = builtins.__import__.original
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Textos de referencia de las cotas isométricas externas. Sin el modo activo se piden
+# uno a uno, un aviso y una selección por tramo; con el modo activo se seleccionan
+# todos con una ventana y cada tramo se queda con el texto más cercano a su punto
+# medio, repartidos todos a la vez para que dos tramos no se lleven el mismo texto.
+import rhinoscriptsyntax as rs
+import cotas_geometria as geo
+import cotas_marcas
+import cotas_transaccion
+
+BATCH_TEXTS_ENTRY = "textos_en_lote"
+
+def batch_texts_mode():
+    return rs.GetDocumentData(cotas_marcas.DOCUMENT_SECTION, BATCH_TEXTS_ENTRY) == "1"
+
+def set_batch_texts_mode(enabled):
+    rs.SetDocumentData(cotas_marcas.DOCUMENT_SECTION, BATCH_TEXTS_ENTRY, "1" if enabled else "0")
+
+def ask_one_by_one(labels):
+    # [contenido o None] por etiqueta, como lo pedían siempre los scripts
+    ask = cotas_transaccion.ask
+    contents = []
+    for label in labels:
+        rs.MessageBox("Seleccione el texto para la {}.".format(label))
+        text_ref = ask(rs.GetObject, "Seleccione el texto para la {}: ".format(label), rs.filter.annotation)
+        contents.append(rs.TextObjectText(text_ref) if text_ref else None)
+    return contents
+
+def ask_batch(labels, midpoints):
+    # Una sola selección para todos los tramos; los que se quedan sin texto dan None
+    selected = cotas_transaccion.ask(
+        rs.GetObjects, "Seleccione los textos de {} ({})".format(", ".join(labels), len(labels)),
+        rs.filter.annotation)
+    return assign_texts(selected, midpoints)
+
+def assign_texts(text_ids, midpoints):
+    # [contenido o None] por punto medio: el texto más cercano, sin repetir ninguno
+    text_ids = [text_id for text_id in (text_ids or []) if rs.IsText(text_id)]
+    if not text_ids:
+        return [None] * len(midpoints)
+    text_points = [rs.TextObjectPoint(text_id) for text_id in text_ids]
+    chosen = geo.assignment(geo.distance_matrix(midpoints, text_points))
+    return [rs.TextObjectText(text_ids[j]) if j is not None else None for j in chosen]
+
+def reference_texts(labels, midpoints):
+    if batch_texts_mode():
+        return ask_batch(labels, midpoints)
+    return ask_one_by_one(labels)
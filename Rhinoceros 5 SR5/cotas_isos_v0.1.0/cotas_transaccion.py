@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import rhinoscriptsyntax as rs
+import scriptcontext as sc
+import Rhino
+import cotas_objetos
+
+LAYER_EVENTS = Rhino.DocObjects.Tables.LayerTableEventType
+
+_active = []
+
+class Transaction(object):
+    # Registra los objetos, capas y grupos que se crean mientras está abierta,
+    # incluidos los de comandos como _Polyline, _Group o _-Import
+    def __init__(self, description):
+        self.description = description
+        self.object_ids = []
+        self.layer_indices = []
+        self.group_count = 0
+        self.initial_layer = None
+        self.redraw_enabled = True
+        self.undo_record = 0
+        # El mismo manejador para += y -=
+        self._object_handler = self.on_add_object
+        self._layer_handler = self.on_layer_event
+
+    def on_add_object(self, sender, e):
+        self.object_ids.append(e.ObjectId)
+
+    def on_layer_event(self, sender, e):
+        if e.EventType == LAYER_EVENTS.Added and e.Document.DocumentId == sc.doc.DocumentId:
+            self.layer_indices.append(e.LayerIndex)
+
+    def begin(self):
+        self.undo_record = sc.doc.BeginUndoRecord(self.description)
+        self.redraw_enabled = rs.EnableRedraw(False)
+        self.initial_layer = rs.CurrentLayer()
+        self.group_count = sc.doc.Groups.Count
+        Rhino.RhinoDoc.AddRhinoObject += self._object_handler
+        Rhino.RhinoDoc.LayerTableEvent += self._layer_handler
+        _active.append(self)
+
+    def rollback(self):
+        if self.object_ids:
+            rs.DeleteObjects(self.object_ids)
+        for index in range(sc.doc.Groups.Count - 1, self.group_count - 1, -1):
+            sc.doc.Groups.Delete(index)
+        # Las subcapas se borran antes que sus padres
+        if rs.IsLayer(self.initial_layer):
+            rs.CurrentLayer(self.initial_layer)
+        for index in reversed(self.layer_indices):
+            layer = sc.doc.Layers[index]
+            if not layer.IsDeleted:
+                rs.PurgeLayer(layer.FullPath)
+
+    def end(self, completed):
+        Rhino.RhinoDoc.AddRhinoObject -= self._object_handler
+        Rhino.RhinoDoc.LayerTableEvent -= self._layer_handler
+        _active.remove(self)
+        # Los atributos de la última cota no pasan a lo que se cree después
+        cotas_objetos.clear_cota_attributes()
+        try:
+            if not completed:
+                self.rollback()
+        finally:
+            # Un solo redibujado al terminar
+            rs.EnableRedraw(self.redraw_enabled)
+            if self.undo_record:
+                sc.doc.EndUndoRecord(self.undo_record)
+
+def run(description, function, *args):
+    # Ejecuta una cota como un solo paso de deshacer y sin redibujar. Si function falla
+    # o no devuelve True (Esc o datos incompletos) se borra todo lo que llegó a crear.
+    transaction = Transaction(description)
+    transaction.begin()
+    completed = False
+    try:
+        completed = function(*args) is True
+    finally:
+        transaction.end(completed)
+    return completed
+
+def ask(function, *args, **kwargs):
+    # Pide datos al usuario con la vista al día: dentro de una transacción el redibujado
+    # solo se reactiva mientras dura la petición
+    if not _active or not _active[-1].redraw_enabled:
+        return function(*args, **kwargs)
+    rs.EnableRedraw(True)
+    try:
+        return function(*args, **kwargs)
+    finally:
+        rs.EnableRedraw(False)
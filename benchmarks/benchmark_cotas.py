@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# Ejecuta cada script de cotas N veces seguidas sobre un mismo documento simulado
+# (una sesión con N cotas) y resume el coste por cota.
+#
+#   python benchmarks/benchmark_cotas.py
+#   python benchmarks/benchmark_cotas.py --sizes 1,100 --scripts lineal --detail 5
+#   python benchmarks/benchmark_cotas.py --sizes 1000 --capa-de-marca
+#   python benchmarks/benchmark_cotas.py --scripts externa --modulos 3 --textos-en-lote
+#   python benchmarks/benchmark_cotas.py --folder "Rhinoceros 5 SR12/cotas_isos_v0.1.0" --csv resultados.csv
+#   python benchmarks/benchmark_cotas.py --latencia 20
+#
+# Los tiempos son los del documento simulado, no los de Rhino: sirven para comparar
+# un cambio con otro. Las llamadas rs por cota y el crecimiento de las tablas sí se
+# trasladan tal cual a Rhino.
+from __future__ import print_function
+
+import argparse
+import csv
+import sys
+
+import escenarios
+import rhino_simulado
+
+DEFAULT_SIZES = "1,10,100,1000,10000"
+
+# (columna, ancho, formato)
+COLUMNS = [
+    ("script", -44, ""),
+    ("n", 6, "d"),
+    ("ms_por_cota", 11, ".3f"),
+    ("ms_ultimas", 10, ".3f"),
+    ("rs_por_cota", 11, ".1f"),
+    ("objetos_por_cota", 16, ".2f"),
+    ("redibujos_por_cota", 18, ".2f"),
+    ("escrituras_por_cota", 19, ".2f"),
+    ("capas_tabla", 11, "d"),
+    ("capas_activas", 13, "d"),
+    ("grupos", 7, "d"),
+    ("error", 0, ""),
+]
+
+# Modo --latencia: primer clic de la sesión frente a los siguientes
+LATENCY_COLUMNS = [
+    ("script", -44, ""),
+    ("primer_clic_ms", 14, ".3f"),
+    ("primera_pregunta_ms", 19, ".3f"),
+    ("clic_estable_ms", 15, ".3f"),
+    ("compilar_ms", 11, ".3f"),
+    ("error", 0, ""),
+]
+
+class SeriesResult(object):
+    def __init__(self, script, count):
+        self.script = script
+        self.count = count
+        self.seconds = []
+        self.calls = {}
+        self.before = None
+        self.after = None
+        self.error = ""
+
+    def add_run(self, run):
+        self.seconds.append(run.seconds)
+        for name, (calls, seconds) in run.calls.items():
+            total_calls, total_seconds = self.calls.get(name, (0, 0.0))
+            self.calls[name] = (total_calls + calls, total_seconds + seconds)
+        if self.before is None:
+            self.before = run.before
+        self.after = run.after
+
+    def growth(self, key):
+        if self.before is None:
+            return 0
+        return self.after[key] - self.before[key]
+
+    def row(self):
+        count = float(self.count)
+        # Latencia de la última décima parte de la serie: muestra si cada cota nueva cuesta más
+        tail = self.seconds[-max(1, len(self.seconds) // 10):] if self.seconds else [0.0]
+        if self.script.batch:
+            tail = [sum(self.seconds) / count]
+        return {
+            "script": self.script.name,
+            "n": self.count,
+            "ms_por_cota": sum(self.seconds) * 1000.0 / count,
+            "ms_ultimas": sum(tail) * 1000.0 / len(tail),
+            "rs_por_cota": sum(calls for calls, seconds in self.calls.values()) / count,
+            "objetos_por_cota": self.growth("objects") / count,
+            "redibujos_por_cota": self.growth("redraws") / count,
+            "escrituras_por_cota": self.growth("writes") / count,
+            "capas_tabla": self.growth("layer_table"),
+            "capas_activas": self.growth("layers"),
+            "grupos": self.growth("groups"),
+            "error": self.error,
+        }
+
+    def top_calls(self, limit):
+        rows = sorted(self.calls.items(), key=lambda item: (-item[1][1], item[0]))
+        return [(name, calls, seconds) for name, (calls, seconds) in rows[:limit]]
+
+def script_answers(script, modules=1):
+    if script.kind == "isometrico_externa":
+        return lambda document, index: escenarios.externa_answers(document, index, modules)
+    return escenarios.ANSWERS[script.kind]
+
+def run_series(script, count, brand_layer=False, modules=1, batch_texts=False):
+    document = escenarios.new_document(brand_layer, batch_texts)
+    result = SeriesResult(script, count)
+    try:
+        if script.batch:
+            answers = escenarios.BATCH_ANSWERS[script.kind](document, count)
+            result.add_run(rhino_simulado.run_script(script.path, answers, document))
+        else:
+            answers = script_answers(script, modules)
+            for index in range(count):
+                result.add_run(rhino_simulado.run_script(script.path, answers(document, index), document))
+    except Exception as e:
+        result.error = "{}: {}".format(type(e).__name__, e)
+    return result
+
+def click_answers(script, document, index):
+    if script.batch:
+        return escenarios.BATCH_ANSWERS[script.kind](document, 1)
+    return escenarios.ANSWERS[script.kind](document, index)
+
+def measure_latency(script, clicks):
+    # Cada clic recompila el script como _-RunPythonScript; el primero, además, importa
+    # y compila todos los módulos cotas_* en una sesión recién abierta
+    rhino_simulado.new_session()
+    document = escenarios.new_document()
+    row = {"script": script.name, "primer_clic_ms": 0.0, "primera_pregunta_ms": None,
+           "clic_estable_ms": 0.0, "compilar_ms": 0.0, "error": ""}
+    try:
+        first = rhino_simulado.run_script(script.path, click_answers(script, document, 0), document)
+        steady = [rhino_simulado.run_script(script.path, click_answers(script, document, index), document)
+                  for index in range(1, clicks + 1)]
+    except Exception as e:
+        row["error"] = "{}: {}".format(type(e).__name__, e)
+        return row
+    row["primer_clic_ms"] = first.seconds * 1000.0
+    if first.first_prompt_seconds is not None:
+        row["primera_pregunta_ms"] = first.first_prompt_seconds * 1000.0
+    if steady:
+        row["clic_estable_ms"] = sum(run.seconds for run in steady) * 1000.0 / len(steady)
+        row["compilar_ms"] = sum(run.compile_seconds for run in steady) * 1000.0 / len(steady)
+    return row
+
+def _cell(value, width, spec):
+    if value is None:
+        value, spec = "-", ""
+    if width < 0:
+        return "{:<{width}{spec}}".format(value, width=-width, spec=spec)
+    return "{:>{width}{spec}}".format(value, width=width, spec=spec)
+
+def print_header(columns=COLUMNS):
+    print(" ".join(_cell(name, width, "") for name, width, spec in columns))
+
+def print_row(row, columns=COLUMNS):
+    print(" ".join(_cell(row[name], width, spec) for name, width, spec in columns))
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark de los scripts de cotas sobre Rhino simulado")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="cotas por documento, separadas por comas (por defecto {})".format(DEFAULT_SIZES))
+    parser.add_argument("--scripts", default="",
+                        help="solo los scripts cuyo nombre contiene alguno de estos textos, separados por comas")
+    parser.add_argument("--folder", default=escenarios.SCRIPTS_DIR, help="carpeta con los cota_*.py")
+    parser.add_argument("--no-batch", action="store_true", help="omitir los scripts que acotan la serie de una vez (lote y cajas)")
+    parser.add_argument("--capa-de-marca", action="store_true",
+                        help="dibujar las cotas en la capa de la marca en lugar de una subcapa por cota")
+    parser.add_argument("--modulos", type=int, default=1,
+                        help="módulos (tramos de anchura) de cada polilínea de las cotas isométricas externas")
+    parser.add_argument("--textos-en-lote", action="store_true",
+                        help="pedir los textos de las cotas isométricas externas con una sola selección")
+    parser.add_argument("--detail", type=int, default=0,
+                        help="mostrar las N llamadas rs más costosas de cada serie")
+    parser.add_argument("--latencia", type=int, default=0, metavar="CLICS",
+                        help="medir el primer clic de una sesión nueva y la media de los CLICS siguientes")
+    parser.add_argument("--csv", help="guardar también los resultados en este CSV")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    filters = [text.strip() for text in args.scripts.split(",") if text.strip()]
+    scripts = [script for script in escenarios.find_scripts(args.folder, not args.no_batch)
+               if not filters or any(text in script.name for text in filters)]
+
+    rows = []
+    columns = LATENCY_COLUMNS if args.latencia else COLUMNS
+    print_header(columns)
+    for script in scripts:
+        if args.latencia:
+            row = measure_latency(script, args.latencia)
+            rows.append(row)
+            print_row(row, columns)
+            sys.stdout.flush()
+            continue
+        for count in sizes:
+            result = run_series(script, count, args.capa_de_marca, args.modulos, args.textos_en_lote)
+            row = result.row()
+            rows.append(row)
+            print_row(row)
+            for name, calls, seconds in result.top_calls(args.detail):
+                print("    {:<40} {:>9} llamadas {:>10.2f} ms".format(name, calls, seconds * 1000.0))
+            sys.stdout.flush()
+
+    if args.csv:
+        with open(args.csv, "w") as output:
+            writer = csv.DictWriter(output, [name for name, width, spec in columns])
+            writer.writeheader()
+            writer.writerows(rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Compara las dos versiones de cotas_geometria.offset_polylines, la de Python puro (la
+# única que corre en IronPython) y la de NumPy, sobre polilíneas isométricas al azar:
+# las dos tienen que dar los mismos vértices o las dos None. Comprueba además que ningún
+# tramo recortado vuelve atrás y que ninguna esquina pasa de MITER_LIMIT.
+#
+#   python benchmarks/comprobar_desfase.py
+#   python benchmarks/comprobar_desfase.py --polilineas 100000 --tramos 5 --semilla 7
+from __future__ import print_function
+
+import argparse
+import math
+import random
+import sys
+
+import escenarios
+
+sys.path.insert(0, escenarios.SCRIPTS_DIR)
+import cotas_geometria as geo
+
+ISO_DIRECTIONS = [(math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+                  for angle in (30, 90, 150, 210, 270, 330)]
+
+def random_polyline(rng, segments):
+    point = (round(rng.uniform(-500, 500), 1), round(rng.uniform(-500, 500), 1), 0.0)
+    points = [point]
+    for i in range(segments):
+        cos_a, sin_a = rng.choice(ISO_DIRECTIONS)
+        length = rng.uniform(5, 300)
+        point = (round(point[0] + cos_a * length, 1), round(point[1] + sin_a * length, 1), 0.0)
+        points.append(point)
+    return points
+
+def offsets(polylines, distances, use_numpy):
+    geo._np = False if use_numpy else None
+    if use_numpy and geo._numpy() is None:
+        raise SystemExit("NumPy no está instalado: no hay nada que comparar")
+    return geo.offset_polylines(polylines, distances, (0, 0, 0))
+
+def same(a, b, tolerance=1e-6):
+    if a is None or b is None:
+        return a is None and b is None
+    return len(a) == len(b) and all(abs(x - y) <= tolerance for p, q in zip(a, b) for x, y in zip(p, q))
+
+def problems(points, distance, vertices):
+    # Tramos del revés y esquinas lejos de su vértice en un resultado
+    found = []
+    for i, (start, end) in enumerate(zip(points[:-1], points[1:])):
+        offset_start, offset_end = vertices[3 * i], vertices[3 * i + 1]
+        if geo.dot(geo.subtract(offset_end, offset_start), geo.subtract(end, start)) < 0:
+            found.append("tramo {} del revés".format(i))
+        if i + 1 < len(points) - 1 and \
+                geo.distance(vertices[3 * i + 2], end) > geo.MITER_LIMIT * abs(distance) + 1e-9:
+            found.append("esquina {} lejos".format(i))
+    return found
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Compara offset_polylines en Python puro y con NumPy")
+    parser.add_argument("--polilineas", type=int, default=20000, help="polilíneas al azar (por defecto 20000)")
+    parser.add_argument("--tramos", type=int, default=3, help="tramos por polilínea (por defecto 3)")
+    parser.add_argument("--semilla", type=int, default=1, help="semilla del generador")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    rng = random.Random(args.semilla)
+    polylines = [random_polyline(rng, args.tramos) for i in range(args.polilineas)]
+    distances = [rng.uniform(1, 100) for points in polylines]
+
+    pure = offsets(polylines, distances, False)
+    vectorized = offsets(polylines, distances, True)
+    differences = [i for i, (a, b) in enumerate(zip(pure, vectorized)) if not same(a, b)]
+    wrong = [(i, found) for i, found in ((i, problems(polylines[i], distances[i], vertices))
+                                         for i, vertices in enumerate(pure) if vertices is not None) if found]
+
+    print("polilíneas: {}  sin desfase (rs.OffsetCurve): {}  distintas: {}  con fallos: {}".format(
+        len(polylines), pure.count(None), len(differences), len(wrong)))
+    for i in differences[:5]:
+        print("  distinta: {} d={:.3f}".format(polylines[i], distances[i]))
+    for i, found in wrong[:5]:
+        print("  {}: {} d={:.3f}".format(", ".join(found), polylines[i], distances[i]))
+    return 1 if differences or wrong else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
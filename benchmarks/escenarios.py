@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# Documentos de partida y respuestas guionizadas para cada tipo de script de cotas.
+# Cada escenario dibuja la cota i en su propia celda de una cuadrícula, para que
+# una hoja con miles de cotas no apile toda la geometría en el mismo sitio.
+import os
+import re
+
+import rhino_simulado
+from rhino_simulado import rhinocommon
+from rhino_simulado.documento import OBJECT_ANNOTATION, OBJECT_CURVE, DimStyle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(ROOT, "Rhinoceros 5 SR5", "cotas_isos_v0.1.0")
+
+SCRIPT_PATTERN = re.compile(r"^cota_(?P<brand>[a-z-]+?)_(?P<kind>lineal_lote|lineal|linea|alineada|"
+                            r"isometrico_externa|isometrico_interna|isometrico_cajas|relacion_hombre-objeto)\.py$")
+
+# cota_tu-home_isometrico_externa.py es una copia del script interno y pide lo mismo
+INTERNA_COPIES = ("cota_tu-home_isometrico_externa.py",)
+
+CELL = 1000.0
+COLUMNS = 100
+
+class Script(object):
+    def __init__(self, path, brand, kind):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.brand = brand
+        self.kind = kind
+
+    @property
+    def batch(self):
+        # Una sola ejecución con todas las cotas de la serie
+        return self.kind in BATCH_ANSWERS
+
+def find_scripts(scripts_dir=SCRIPTS_DIR, include_batch=True):
+    scripts = []
+    for file_name in sorted(os.listdir(scripts_dir)):
+        match = SCRIPT_PATTERN.match(file_name)
+        if not match:
+            continue
+        kind = match.group("kind")
+        if kind == "linea":
+            kind = "lineal"
+        if file_name in INTERNA_COPIES:
+            kind = "isometrico_interna"
+        if kind in BATCH_ANSWERS and not include_batch:
+            continue
+        scripts.append(Script(os.path.join(scripts_dir, file_name), match.group("brand"), kind))
+    return scripts
+
+def cell_origin(index):
+    return ((index % COLUMNS) * CELL, (index // COLUMNS) * CELL, 0.0)
+
+def _at(origin, x, y):
+    return (origin[0] + x, origin[1] + y, 0.0)
+
+def import_dim_style(document, path):
+    # Estilo "Base" de dim_style.3dm, en milímetros
+    if document.dim_style("Base") is None:
+        document.dim_styles.append(DimStyle("Base", extension=10.0, offset=10.0, text_gap=10.0,
+                                            text_height=30.0, arrow_length=15.0, font="Arial"))
+
+# Figura de referencia_dim_hombre-objeto.3dm: capa Figura-Humana con las subcapas de
+# línea y cota y un objeto en cada una, [(capa, capa madre, tipo, valores)]
+HUMAN_FIGURE = [
+    ("Figura-Humana", None, OBJECT_CURVE,
+     {"points": [(0, 0, 0), (0, 1700, 0), (200, 1700, 0), (200, 0, 0)]}),
+    ("Figura-Humana_linea", "Figura-Humana", OBJECT_CURVE,
+     {"points": [(300, 0, 0), (300, 1700, 0)]}),
+    ("Figura-Humana_cota", "Figura-Humana", OBJECT_ANNOTATION,
+     {"text": "170 cm", "plane": rhino_simulado.Plane.world_xy((320, 850, 0)), "height": 30.0, "font": "Arial",
+      "font_style": 0, "justification": None}),
+]
+
+def read_human_figure(path):
+    # Lo que devuelve File3dm.Read del archivo: tabla de capas y los tres objetos
+    model = rhinocommon.File3dm()
+    for index, (layer_name, parent, object_type, values) in enumerate(HUMAN_FIGURE):
+        model.Layers.append(rhinocommon.FileLayer(layer_name))
+        attributes = rhinocommon.ObjectAttributes()
+        attributes.LayerIndex = index
+        if object_type == OBJECT_ANNOTATION:
+            geometry = rhinocommon.TextEntity(object_type, values)
+        else:
+            geometry = rhinocommon.GeometryBase(object_type, values)
+        model.Objects.append(rhinocommon.File3dmObject(geometry, attributes))
+    return model
+
+def import_human_figure(document, path):
+    # _-Import del mismo archivo, para cuando File3dm no puede leerlo. Como en Rhino, las
+    # capas se reutilizan si ya existen en el documento y los objetos llegan agrupados.
+    layers = {}
+    objects = []
+    for layer_name, parent, object_type, values in HUMAN_FIGURE:
+        parent_layer = layers.get(parent)
+        full_path = layer_name if parent_layer is None else parent_layer.full_path + "::" + layer_name
+        layer = document.layer_by_path(full_path) or document.add_layer(layer_name, parent_layer)
+        layers[layer_name] = layer
+        objects.append(document.add_object(object_type, dict(values), layer))
+    group_name = document.add_group()
+    document.add_to_group(objects, group_name)
+
+# Modo de cota_modo_textos_en_lote.py en los datos del documento
+BATCH_TEXTS_ENTRY = ("cotas_isos", "textos_en_lote")
+
+def new_document(brand_layer=False, batch_texts=False):
+    document = rhino_simulado.Document()
+    if brand_layer:
+        # Modo de cota_modo_capa_de_marca.py: cotas en la capa de la marca, sin subcapas
+        document.data[("cotas_isos", "cotas_en_capa_de_marca")] = "1"
+    if batch_texts:
+        document.data[BATCH_TEXTS_ENTRY] = "1"
+    document.importers["dim_style.3dm"] = import_dim_style
+    document.importers["referencia_dim_hombre-objeto.3dm"] = import_human_figure
+    rhinocommon.File3dm.readers["referencia_dim_hombre-objeto.3dm"] = read_human_figure
+    import_dim_style(document, None)
+
+    # Textos y cota de referencia que los scripts isométricos piden seleccionar
+    references = document.add_layer("Referencias")
+    plane = rhino_simulado.Plane.world_xy((-CELL, 0, 0))
+    document.labels = [document.add_text(text, plane, 40.0, layer=references).Id
+                       for text in ("45 cm", "60 cm", "120 cm")]
+    document.reference_dimension = document.add_dimension(plane, (-CELL, 0, 0), (-CELL + 450, 0, 0),
+                                                          (-CELL, 50, 0), references).Id
+    return document
+
+def lineal_answers(document, index):
+    origin = cell_origin(index)
+    if index % 2:
+        return [origin, _at(origin, 0, 450 + index % 7 * 10), _at(origin, -120, 200)]
+    return [origin, _at(origin, 450 + index % 7 * 10, 0), _at(origin, 200, 120)]
+
+def alineada_answers(document, index):
+    origin = cell_origin(index)
+    return [origin, _at(origin, 390, 225 + index % 7 * 10), _at(origin, 150, 300)]
+
+def externa_answers(document, index, modules=1):
+    # Polilínea isométrica: altura, profundidad y la anchura de cada módulo, que se
+    # reparten los mismos 346.4 de la celda; un texto de referencia por tramo, o todos
+    # en una sola selección con los textos en lote
+    origin = cell_origin(index)
+    polyline = [origin, _at(origin, 0, 400), _at(origin, 346.4, 600)]
+    for module in range(1, modules + 1):
+        polyline.append(_at(origin, 346.4 + 346.4 * module / modules, 600 - 200.0 * module / modules))
+    labels = [document.labels[i % len(document.labels)] for i in range(modules + 2)]
+    if document.data.get(BATCH_TEXTS_ENTRY) == "1":
+        return [polyline, origin, _at(origin, 40, 0), labels]
+    return [polyline, origin, _at(origin, 40, 0)] + labels
+
+def interna_answers(document, index):
+    origin = cell_origin(index)
+    start, end = _at(origin, 0, 0), _at(origin, 346.4, 200)
+    return [start, end, _at(origin, 296.4, 286.6), document.reference_dimension]
+
+def hombre_objeto_answers(document, index):
+    return []
+
+def batch_answers(document, count):
+    # Sin curvas preseleccionadas: pares de puntos, Enter y distancia de la línea de cota
+    answers = [None]
+    for index in range(count):
+        start, end, location = lineal_answers(document, index)
+        answers.extend([start, end])
+    answers.extend([None, 120.0])
+    return answers
+
+def box_lines(document, origin):
+    # Caja isométrica como la dibuja un delineante: el contorno hexagonal con _Polyline
+    # y la "Y" de la esquina superior delantera con otra polilínea y una línea
+    corner = _at(origin, 300, 600)
+    depth, width, height = (173.2, 100.0, 0.0), (-216.5, 125.0, 0.0), (0.0, -350.0, 0.0)
+
+    def at(*vectors):
+        point = corner
+        for vector in vectors:
+            point = (point[0] + vector[0], point[1] + vector[1], 0.0)
+        return point
+    outline = [at(height), at(depth, height), at(depth), at(depth, width), at(width), at(width, height), at(height)]
+    return [document.add_curve(outline).Id, document.add_curve([at(depth), corner, at(width)]).Id,
+            document.add_curve([corner, at(height)]).Id]
+
+def box_labels(document, origin):
+    # Un texto de referencia junto a la altura, la profundidad y la anchura de la caja
+    references = document.layer_by_path("Referencias")
+    corner = _at(origin, 300, 600)
+    points = [(corner[0] - 300.0, corner[1] - 50.0), (corner[0] - 150.0, corner[1] + 250.0),
+              (corner[0] + 110.0, corner[1] + 240.0)]
+    return [document.add_text(text, rhino_simulado.Plane.world_xy((x, y, 0)), 40.0, layer=references).Id
+            for text, (x, y) in zip(("35 cm", "20 cm", "25 cm"), points)]
+
+def cajas_answers(document, count):
+    # Las líneas de todas las cajas en una selección, la distancia de las cotas y los
+    # textos de referencia de todas las cajas en otra selección
+    lines = []
+    labels = []
+    for index in range(count):
+        lines.extend(box_lines(document, cell_origin(index)))
+        labels.extend(box_labels(document, cell_origin(index)))
+    return [lines, 60.0, labels]
+
+ANSWERS = {
+    "lineal": lineal_answers,
+    "alineada": alineada_answers,
+    "isometrico_externa": externa_answers,
+    "isometrico_interna": interna_answers,
+    "relacion_hombre-objeto": hombre_objeto_answers,
+}
+
+# Scripts que acotan toda la serie en una sola ejecución
+BATCH_ANSWERS = {
+    "lineal_lote": batch_answers,
+    "isometrico_cajas": cajas_answers,
+}
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+# Sustituto en memoria de rhinoscriptsyntax y scriptcontext para ejecutar los
+# scripts de cotas fuera de Rhino y contar y medir cada llamada.
+from .documento import Document, Plane, Point3d
+from .ejecutor import ScriptRun, install, new_session, run_script
+from .medicion import stats
@@ -0,0 +1,742 @@
+# -*- coding: utf-8 -*-
+# Documento de Rhino en memoria. Modela solo lo que usan los scripts de cotas:
+# capas (las borradas siguen ocupando su sitio en la tabla, como en Rhino), objetos,
+# grupos, bloques, estilos de cota, datos del documento y respuestas guionizadas
+# para GetPoint/GetObject/GetReal/Command.
+import collections
+import math
+import os
+import shlex
+import uuid
+
+from . import medicion
+from .geometria import Plane, Point3d
+from .rhinocommon import (DocObjects, GeometryBase, LayerTableEventArgs, ObjectAttributes, RhinoDoc,
+                          RhinoObjectEventArgs, TextEntity)
+
+LAYER_EVENTS = DocObjects.Tables.LayerTableEventType
+
+OBJECT_CURVE = 4
+OBJECT_ANNOTATION = 512
+OBJECT_INSTANCE = 4096
+OBJECT_HATCH = 65536
+
+# Fuente de color y grosor de impresión: 0 por capa, 1 por objeto, 3 por padre
+SOURCE_BY_LAYER = 0
+SOURCE_BY_OBJECT = 1
+
+def offset_polyline(points, direction_point, distance):
+    # Desfase con esquinas en punta. Cada tramo desfasado conserva sus dos vértices y la
+    # esquina se añade entre ellos: tramo i = vértices (3i, 3i+1), como esperan los scripts
+    # isométricos externos al leer PolylineVertices del desfase.
+    first = (points[1][0] - points[0][0], points[1][1] - points[0][1])
+    side = first[0] * (direction_point[1] - points[0][1]) - first[1] * (direction_point[0] - points[0][0])
+    sign = -1.0 if side < 0 else 1.0
+
+    segments = []
+    for start, end in zip(points[:-1], points[1:]):
+        dx, dy = end[0] - start[0], end[1] - start[1]
+        length = math.hypot(dx, dy) or 1.0
+        nx, ny = -dy / length * distance * sign, dx / length * distance * sign
+        segments.append((Point3d(start[0] + nx, start[1] + ny, start[2]),
+                         Point3d(end[0] + nx, end[1] + ny, end[2])))
+
+    vertices = list(segments[0])
+    for previous, current in zip(segments[:-1], segments[1:]):
+        vertices.append(_line_intersection(previous, current) or previous[1])
+        vertices.extend(current)
+    return vertices
+
+def _line_intersection(a, b):
+    d1 = (a[1][0] - a[0][0], a[1][1] - a[0][1])
+    d2 = (b[1][0] - b[0][0], b[1][1] - b[0][1])
+    denominator = d1[0] * d2[1] - d1[1] * d2[0]
+    if abs(denominator) < 1e-12:
+        return None
+    t = ((b[0][0] - a[0][0]) * d2[1] - (b[0][1] - a[0][1]) * d2[0]) / denominator
+    return Point3d(a[0][0] + d1[0] * t, a[0][1] + d1[1] * t, a[1][2])
+
+def transform_point(xform, point):
+    x, y, z = point[0], point[1], point[2] if len(point) > 2 else 0.0
+    return Point3d(xform[0][0] * x + xform[0][1] * y + xform[0][2] * z + xform[0][3],
+                   xform[1][0] * x + xform[1][1] * y + xform[1][2] * z + xform[1][3],
+                   xform[2][0] * x + xform[2][1] * y + xform[2][2] * z + xform[2][3])
+
+class Layer(object):
+    def __init__(self, layer_id, index, name, parent, color):
+        self.Id = layer_id
+        self.index = index
+        self.name = name
+        self.parent = parent
+        self.color = tuple(color) if color else (0, 0, 0)
+        self.print_width = 0.0
+        self.deleted = False
+        self.children = []
+        self.objects = collections.OrderedDict()
+
+    @property
+    def full_path(self):
+        if self.parent is None:
+            return self.name
+        return self.parent.full_path + "::" + self.name
+
+    FullPath = property(lambda self: self.full_path)
+    Name = property(lambda self: self.name)
+    LayerIndex = property(lambda self: self.index)
+    IsDeleted = property(lambda self: self.deleted)
+
+    def subtree(self):
+        layers = [self]
+        for child in self.children:
+            layers.extend(child.subtree())
+        return layers
+
+class RhinoObject(object):
+    def __init__(self, object_id, object_type, geometry, layer, document=None):
+        self.Id = object_id
+        self.document = document
+        self.type = object_type
+        self.geometry = geometry
+        self.layer = layer
+        self.name = None
+        self.color = (0, 0, 0)
+        self.color_source = SOURCE_BY_LAYER
+        self.print_width = 0.0
+        self.print_width_source = SOURCE_BY_LAYER
+        self.groups = []
+        self.user_text = {}
+
+    @property
+    def Attributes(self):
+        attributes = ObjectAttributes()
+        attributes.LayerIndex = self.layer.index
+        attributes.ObjectColor = self.color
+        attributes.ColorSource = self.color_source
+        attributes.PlotWeight = self.print_width
+        attributes.PlotWeightSource = self.print_width_source
+        attributes.Name = self.name
+        attributes.user_strings = dict(self.user_text)
+        attributes.group_list = [self.document.group_index(name) for name in self.groups]
+        return attributes
+
+    @property
+    def Geometry(self):
+        if self.type == OBJECT_ANNOTATION and "text" in self.geometry:
+            return TextEntity(self.type, self.geometry)
+        return GeometryBase(self.type, self.geometry)
+
+    def apply_attributes(self, attributes):
+        # Sin mover de capa: eso lo hace Document.move_object_to_layer
+        self.color = tuple(attributes.ObjectColor)
+        self.color_source = attributes.ColorSource
+        self.print_width = float(attributes.PlotWeight)
+        self.print_width_source = attributes.PlotWeightSource
+        self.name = attributes.Name
+        self.user_text = dict(attributes.user_strings)
+
+    def points(self):
+        geometry = self.geometry
+        if "points" in geometry:
+            return list(geometry["points"])
+        if "plane" in geometry and "start" in geometry:
+            return [geometry["start"], geometry["end"], geometry["location"]]
+        if "plane" in geometry:
+            return [geometry["plane"].Origin]
+        if "xform" in geometry:
+            return [transform_point(geometry["xform"], (0, 0, 0))]
+        return []
+
+    def move(self, vector):
+        geometry = self.geometry
+        if "points" in geometry:
+            geometry["points"] = [Point3d(pt[0] + vector[0], pt[1] + vector[1], pt[2] + vector[2])
+                                  for pt in geometry["points"]]
+        for key in ("start", "end", "location"):
+            if key in geometry:
+                pt = geometry[key]
+                geometry[key] = Point3d(pt[0] + vector[0], pt[1] + vector[1], pt[2] + vector[2])
+        if "plane" in geometry:
+            geometry["plane"] = geometry["plane"].moved(vector)
+        if "xform" in geometry:
+            xform = [list(row) for row in geometry["xform"]]
+            for row, delta in zip(xform, vector):
+                row[3] += delta
+            geometry["xform"] = xform
+
+class DimStyle(object):
+    def __init__(self, name, extension=1.0, offset=0.5, text_gap=0.25, text_height=1.0,
+                 arrow_length=1.0, font="Arial", text_alignment=2):
+        self.Name = name
+        self.ExtensionLineExtension = extension
+        self.ExtensionLineOffset = offset
+        self.TextGap = text_gap
+        self.TextHeight = text_height
+        self.ArrowLength = arrow_length
+        self.Font = font
+        self.TextAlignment = text_alignment
+
+    def copy(self):
+        style = DimStyle(self.Name)
+        style.__dict__.update(self.__dict__)
+        return style
+
+class InstanceDefinition(object):
+    def __init__(self, definition_id, name, objects, base_point):
+        self.Id = definition_id
+        self.Name = name
+        self.objects = objects
+        self.base_point = base_point
+        self.Description = ""
+        self.Index = -1
+
+class DimStyleTable(object):
+    # Como Rhino 5: los estilos no tienen ArrowType1 ni bloques de flecha
+    def __init__(self, document):
+        self.document = document
+
+    def Find(self, name, ignore_deleted=True):
+        for index, style in enumerate(self.document.dim_styles):
+            if style.Name == name:
+                return index
+        return -1
+    Find = medicion.measured("sc.doc.DimStyles.Find", Find)
+
+    def __getitem__(self, index):
+        return self.document.dim_styles[index].copy()
+
+    def __len__(self):
+        return len(self.document.dim_styles)
+
+    def Modify(self, dim_style, index, quiet=True):
+        self.document.dim_styles[index] = dim_style.copy()
+        return True
+    Modify = medicion.measured("sc.doc.DimStyles.Modify", Modify)
+
+class InstanceDefinitionTable(object):
+    def __init__(self, document):
+        self.document = document
+
+    def Find(self, name, ignore_deleted=True):
+        definition = self.document.blocks.get(name)
+        if definition is not None:
+            definition.Index = list(self.document.blocks).index(name)
+        return definition
+    Find = medicion.measured("sc.doc.InstanceDefinitions.Find", Find)
+
+    def _objects(self, geometry):
+        # Como en la definición de rs.AddBlock: [(tipo, valores)], con la tipografía ya resuelta
+        objects = []
+        for item in geometry:
+            values = dict(item.values)
+            if isinstance(item, TextEntity) and item.FontIndex >= 0:
+                values["font"] = self.document.fonts[item.FontIndex]
+            objects.append((item.object_type, values))
+        return objects
+
+    def Add(self, name, description, base_point, geometry, attributes):
+        if name in self.document.blocks:
+            return -1
+        definition = InstanceDefinition(self.document.new_id(), name, self._objects(geometry), Point3d(base_point))
+        definition.Description = description
+        self.document.blocks[name] = definition
+        self.document.writes += 1
+        return len(self.document.blocks) - 1
+    Add = medicion.measured("sc.doc.InstanceDefinitions.Add", Add)
+
+    def ModifyGeometry(self, index, geometry, attributes):
+        definition = list(self.document.blocks.values())[index]
+        definition.objects = self._objects(geometry)
+        self.document.writes += 1
+        return True
+    ModifyGeometry = medicion.measured("sc.doc.InstanceDefinitions.ModifyGeometry", ModifyGeometry)
+
+    def Modify(self, index, name, description, quiet):
+        definition = list(self.document.blocks.values())[index]
+        if name != definition.Name:
+            return False
+        definition.Description = description
+        return True
+    Modify = medicion.measured("sc.doc.InstanceDefinitions.Modify", Modify)
+
+class FontTable(object):
+    def __init__(self, document):
+        self.document = document
+
+    def FindOrCreate(self, face, bold, italic):
+        fonts = self.document.fonts
+        if face not in fonts:
+            fonts.append(face)
+        return fonts.index(face)
+    FindOrCreate = medicion.measured("sc.doc.Fonts.FindOrCreate", FindOrCreate)
+
+    def __len__(self):
+        return len(self.document.blocks)
+
+class ObjectTable(object):
+    # sc.doc.Objects: cada Add* crea el objeto ya con sus atributos, en una sola escritura
+    def __init__(self, document):
+        self.document = document
+
+    def _add(self, object_type, geometry, attributes):
+        document = self.document
+        if attributes is None:
+            return document.add_object(object_type, geometry).Id
+        rhino_object = document.add_object(object_type, geometry, document.layers[attributes.LayerIndex])
+        rhino_object.apply_attributes(attributes)
+        return rhino_object.Id
+
+    def AddLine(self, start, end, attributes=None):
+        return self._add(OBJECT_CURVE, {"points": [Point3d(start), Point3d(end)]}, attributes)
+    AddLine = medicion.measured("sc.doc.Objects.AddLine", AddLine)
+
+    def AddPolyline(self, points, attributes=None):
+        return self._add(OBJECT_CURVE, {"points": [Point3d(pt) for pt in points]}, attributes)
+    AddPolyline = medicion.measured("sc.doc.Objects.AddPolyline", AddPolyline)
+
+    def AddText(self, text, plane, height, font, bold, italic, justification, attributes=None):
+        font_style = (1 if bold else 0) + (2 if italic else 0)
+        return self._add(OBJECT_ANNOTATION, {"text": text, "plane": plane, "height": height, "font": font,
+                                             "font_style": font_style, "justification": justification or None},
+                         attributes)
+    AddText = medicion.measured("sc.doc.Objects.AddText", AddText)
+
+    def AddInstanceObject(self, index, xform, attributes=None):
+        block_name = list(self.document.blocks.keys())[index]
+        return self._add(OBJECT_INSTANCE, {"block": block_name, "xform": [list(row) for row in xform]}, attributes)
+    AddInstanceObject = medicion.measured("sc.doc.Objects.AddInstanceObject", AddInstanceObject)
+
+    def Find(self, object_id):
+        return self.document.find_object(object_id)
+    Find = medicion.measured("sc.doc.Objects.Find", Find)
+
+    def ModifyAttributes(self, object_id, attributes, quiet):
+        rhino_object = self.document.find_object(object_id)
+        if rhino_object is None:
+            return False
+        rhino_object.apply_attributes(attributes)
+        if attributes.LayerIndex != rhino_object.layer.index:
+            self.document.move_object_to_layer(rhino_object, self.document.layers[attributes.LayerIndex])
+        else:
+            self.document.writes += 1
+        return True
+    ModifyAttributes = medicion.measured("sc.doc.Objects.ModifyAttributes", ModifyAttributes)
+
+class LayerTable(object):
+    def __init__(self, document):
+        self.document = document
+
+    def FindByFullPath(self, layer_path, ignore_deleted_layers=True):
+        layer = self.document.layer_by_path(layer_path)
+        return layer.index if layer is not None else -1
+    FindByFullPath = medicion.measured("sc.doc.Layers.FindByFullPath", FindByFullPath)
+
+    def __getitem__(self, index):
+        return self.document.layers[index]
+
+    def __len__(self):
+        return len(self.document.layers)
+
+    @property
+    def Count(self):
+        return len(self.document.layers)
+
+    @property
+    def CurrentLayerIndex(self):
+        return self.document.current_layer.index
+
+class GroupTable(object):
+    def __init__(self, document):
+        self.document = document
+
+    @property
+    def Count(self):
+        return len(self.document.group_table)
+
+    def Delete(self, index):
+        return self.document.delete_group(self.document.group_table[index])
+    Delete = medicion.measured("sc.doc.Groups.Delete", Delete)
+
+    def Add(self, *args):
+        # Add(), Add(nombre), Add(ids) o Add(nombre, ids); devuelve el índice o -1
+        name = args[0] if args and isinstance(args[0], str) else None
+        object_ids = args[-1] if args and not isinstance(args[-1], str) else []
+        group_name = self.document.add_group(name)
+        if group_name is None:
+            return -1
+        rhino_objects = [self.document.find_object(object_id) for object_id in object_ids]
+        self.document.add_to_group([obj for obj in rhino_objects if obj is not None], group_name)
+        return len(self.document.group_table) - 1
+    Add = medicion.measured("sc.doc.Groups.Add", Add)
+
+    def Find(self, name, ignore_deleted):
+        if name not in self.document.groups:
+            return -1
+        return self.document.group_index(name)
+    Find = medicion.measured("sc.doc.Groups.Find", Find)
+
+    def ChangeGroupName(self, index, name):
+        return self.document.rename_group(self.document.group_table[index], name)
+    ChangeGroupName = medicion.measured("sc.doc.Groups.ChangeGroupName", ChangeGroupName)
+
+    def AddToGroup(self, index, object_ids):
+        rhino_objects = [self.document.find_object(object_id) for object_id in object_ids]
+        self.document.add_to_group([obj for obj in rhino_objects if obj is not None],
+                                   self.document.group_table[index])
+        return True
+    AddToGroup = medicion.measured("sc.doc.Groups.AddToGroup", AddToGroup)
+
+    def GroupName(self, index):
+        return self.document.group_table[index]
+    GroupName = medicion.measured("sc.doc.Groups.GroupName", GroupName)
+
+class Viewport(object):
+    def ConstructionPlane(self):
+        return Plane.world_xy()
+
+class ActiveView(object):
+    def __init__(self):
+        self.ActiveViewport = Viewport()
+
+class ViewTable(object):
+    def __init__(self, document):
+        self.document = document
+        self.RedrawEnabled = True
+        self.ActiveView = ActiveView()
+
+    def Redraw(self):
+        self.document.redraws += 1
+    Redraw = medicion.measured("sc.doc.Views.Redraw", Redraw)
+
+def _command_polyline(document, arguments):
+    points = document.next_answer("Command", "_Polyline")
+    if not points or len(points) < 2:
+        return False
+    document.add_curve(points)
+    return True
+
+def _command_group(document, arguments):
+    if not document.selected:
+        return False
+    group_name = document.add_group()
+    document.add_to_group(list(document.selected.values()), group_name)
+    return True
+
+def _command_import(document, arguments):
+    if not arguments:
+        return False
+    path = arguments[0]
+    importer = document.importers.get(os.path.basename(path))
+    if importer is None:
+        document.messages.append("No se puede importar: {}".format(path))
+        return False
+    importer(document, path)
+    return True
+
+def _command_ignored(document, arguments):
+    return True
+
+class Document(object):
+    _documents = 0
+
+    def __init__(self, tolerance=0.001):
+        Document._documents += 1
+        self.DocumentId = Document._documents
+        self.tolerance = tolerance
+        self._next_id = 0
+        self.layers = []
+        self._layers_by_path = {}
+        self._layers_by_name = {}
+        self._layers_by_id = {}
+        self.Layers = LayerTable(self)
+        self.current_layer = self.add_layer("Default")
+        self.objects = collections.OrderedDict()
+        self.selected = collections.OrderedDict()
+        self.groups = collections.OrderedDict()
+        self.group_table = []
+        self.blocks = collections.OrderedDict()
+        self.dim_styles = [DimStyle("Default")]
+        self.current_dim_style = "Default"
+        self.data = {}
+        self.answers = collections.deque()
+        self.prompts = []
+        # medicion.clock() de la primera pregunta desde que ejecutor lo dejó en None
+        self.first_prompt_clock = None
+        self.messages = []
+        self.commands = {
+            "polyline": _command_polyline,
+            "group": _command_group,
+            "import": _command_import,
+            "ortho": _command_ignored,
+        }
+        self.importers = {}
+        self.last_created = []
+        self._command_created = None
+        self.redraws = 0
+        # Escrituras en la tabla de objetos: altas, bajas y cada cambio de atributos o geometría
+        self.writes = 0
+        self.undo_records = []
+        self._open_undo_records = {}
+        self.escape_pending = False
+        self.DimStyles = DimStyleTable(self)
+        self.InstanceDefinitions = InstanceDefinitionTable(self)
+        self.fonts = []
+        self.Fonts = FontTable(self)
+        self.Groups = GroupTable(self)
+        self.Objects = ObjectTable(self)
+        self.Views = ViewTable(self)
+
+    def CreateDefaultAttributes(self):
+        attributes = ObjectAttributes()
+        attributes.LayerIndex = self.current_layer.index
+        return attributes
+
+    def new_id(self):
+        self._next_id += 1
+        return uuid.UUID(int=self._next_id)
+
+    # Respuestas guionizadas: un valor, una función (documento, mensaje) o None para Esc
+    def push_answers(self, answers):
+        self.answers.extend(answers)
+
+    def next_answer(self, function, prompt):
+        if self.first_prompt_clock is None:
+            self.first_prompt_clock = medicion.clock()
+        self.prompts.append((function, prompt))
+        if not self.answers:
+            return None
+        answer = self.answers.popleft()
+        if callable(answer):
+            answer = answer(self, prompt)
+        return answer
+
+    def run_command(self, macro):
+        tokens = shlex.split(macro)
+        if not tokens:
+            return False
+        handler = self.commands.get(tokens[0].lstrip("_-").lower())
+        if handler is None:
+            self.messages.append("Comando no simulado: {}".format(tokens[0]))
+            return False
+        self._command_created = []
+        try:
+            result = handler(self, tokens[1:])
+        finally:
+            created, self._command_created = self._command_created, None
+        self.last_created = [object_id for object_id in created if object_id in self.objects]
+        return result
+
+    def BeginUndoRecord(self, description):
+        serial = len(self.undo_records) + 1
+        self.undo_records.append(description)
+        self._open_undo_records[serial] = description
+        return serial
+    BeginUndoRecord = medicion.measured("sc.doc.BeginUndoRecord", BeginUndoRecord)
+
+    def EndUndoRecord(self, serial):
+        return self._open_undo_records.pop(serial, None) is not None
+    EndUndoRecord = medicion.measured("sc.doc.EndUndoRecord", EndUndoRecord)
+
+    # Capas: cada cambio lanza RhinoDoc.LayerTableEvent como en Rhino
+    def layer_event(self, event_type, layer):
+        RhinoDoc.LayerTableEvent.fire(self.Layers, LayerTableEventArgs(self, event_type, layer.index))
+
+    def find_layer(self, layer):
+        if isinstance(layer, Layer):
+            return None if layer.deleted else layer
+        if isinstance(layer, uuid.UUID):
+            return self._layers_by_id.get(layer)
+        found = self._layers_by_path.get(layer)
+        if found is None:
+            by_name = self._layers_by_name.get(layer)
+            if by_name:
+                found = by_name[0]
+        return found
+
+    def layer_by_path(self, full_path):
+        return self._layers_by_path.get(full_path)
+
+    def add_layer(self, name, parent=None, color=None):
+        layer = Layer(self.new_id(), len(self.layers), name, parent, color)
+        self.layers.append(layer)
+        if parent is not None:
+            parent.children.append(layer)
+        self._index_layer(layer)
+        self.layer_event(LAYER_EVENTS.Added, layer)
+        return layer
+
+    def _index_layer(self, layer):
+        self._layers_by_path[layer.full_path] = layer
+        self._layers_by_name.setdefault(layer.name, []).append(layer)
+        self._layers_by_id[layer.Id] = layer
+
+    def _unindex_layer(self, layer):
+        self._layers_by_path.pop(layer.full_path, None)
+        same_name = self._layers_by_name.get(layer.name, [])
+        if layer in same_name:
+            same_name.remove(layer)
+        if not same_name:
+            self._layers_by_name.pop(layer.name, None)
+        self._layers_by_id.pop(layer.Id, None)
+
+    def rename_layer(self, layer, new_name):
+        subtree = layer.subtree()
+        for item in subtree:
+            self._unindex_layer(item)
+        layer.name = new_name
+        for item in subtree:
+            self._index_layer(item)
+        self.layer_event(LAYER_EVENTS.Modified, layer)
+
+    def modify_layer(self, layer, color=None, print_width=None):
+        if color is not None:
+            layer.color = tuple(color)
+        if print_width is not None:
+            layer.print_width = float(print_width)
+        self.layer_event(LAYER_EVENTS.Modified, layer)
+
+    def set_current_layer(self, layer):
+        self.current_layer = layer
+        self.layer_event(LAYER_EVENTS.Current, layer)
+
+    def delete_layer(self, layer):
+        subtree = layer.subtree()
+        if self.current_layer in subtree:
+            return False
+        for item in subtree:
+            for rhino_object in list(item.objects.values()):
+                self.delete_object(rhino_object)
+        for item in reversed(subtree):
+            self._unindex_layer(item)
+            item.deleted = True
+        if layer.parent is not None:
+            layer.parent.children.remove(layer)
+        for item in reversed(subtree):
+            self.layer_event(LAYER_EVENTS.Deleted, item)
+        return True
+
+    def active_layers(self):
+        return [layer for layer in self.layers if not layer.deleted]
+
+    # Objetos
+    def find_object(self, object_id):
+        if isinstance(object_id, (list, tuple)) and len(object_id) == 1:
+            object_id = object_id[0]
+        if isinstance(object_id, RhinoObject):
+            object_id = object_id.Id
+        if not isinstance(object_id, uuid.UUID):
+            try:
+                object_id = uuid.UUID(str(object_id))
+            except ValueError:
+                return None
+        return self.objects.get(object_id)
+
+    def add_object(self, object_type, geometry, layer=None):
+        layer = layer or self.current_layer
+        rhino_object = RhinoObject(self.new_id(), object_type, geometry, layer, self)
+        self.objects[rhino_object.Id] = rhino_object
+        layer.objects[rhino_object.Id] = rhino_object
+        self.writes += 1
+        if self._command_created is not None:
+            self._command_created.append(rhino_object.Id)
+        RhinoDoc.AddRhinoObject.fire(self, RhinoObjectEventArgs(rhino_object))
+        return rhino_object
+
+    def add_curve(self, points, layer=None):
+        return self.add_object(OBJECT_CURVE, {"points": [Point3d(pt) for pt in points]}, layer)
+
+    def add_hatch(self, boundary_points, pattern, layer=None):
+        return self.add_object(OBJECT_HATCH, {"points": [Point3d(pt) for pt in boundary_points],
+                                              "pattern": pattern}, layer)
+
+    def add_text(self, text, plane, height=1.0, font="Arial", font_style=0, justification=None, layer=None):
+        return self.add_object(OBJECT_ANNOTATION, {"text": text, "plane": plane, "height": height, "font": font,
+                                                   "font_style": font_style, "justification": justification}, layer)
+
+    def add_dimension(self, plane, start, end, location, layer=None):
+        return self.add_object(OBJECT_ANNOTATION, {"plane": plane, "start": Point3d(start), "end": Point3d(end),
+                                                   "location": Point3d(location), "style": self.current_dim_style,
+                                                   "user_text": None}, layer)
+
+    def add_instance(self, block_name, xform, layer=None):
+        return self.add_object(OBJECT_INSTANCE, {"block": block_name, "xform": xform}, layer)
+
+    def delete_object(self, rhino_object):
+        self.writes += 1
+        self.objects.pop(rhino_object.Id, None)
+        self.selected.pop(rhino_object.Id, None)
+        rhino_object.layer.objects.pop(rhino_object.Id, None)
+        for group_name in rhino_object.groups:
+            members = self.groups.get(group_name)
+            if members is not None:
+                members.pop(rhino_object.Id, None)
+
+    def move_object_to_layer(self, rhino_object, layer):
+        rhino_object.layer.objects.pop(rhino_object.Id, None)
+        rhino_object.layer = layer
+        layer.objects[rhino_object.Id] = rhino_object
+        self.writes += 1
+
+    # Grupos: como en Rhino, la tabla no se encoge al vaciarse un grupo
+    def add_group(self, name=None):
+        if name is None:
+            number = len(self.group_table) + 1
+            name = "Group{:02d}".format(number)
+            while name in self.groups:
+                number += 1
+                name = "Group{:02d}".format(number)
+        elif name in self.groups:
+            return None
+        self.groups[name] = collections.OrderedDict()
+        self.group_table.append(name)
+        return name
+
+    def group_index(self, group_name):
+        # Un nombre borrado y vuelto a usar ocupa la última entrada
+        table = self.group_table
+        return len(table) - 1 - table[::-1].index(group_name)
+
+    def rename_group(self, group_name, new_name):
+        if group_name not in self.groups or new_name in self.groups:
+            return False
+        members = self.groups.pop(group_name)
+        self.groups[new_name] = members
+        self.group_table[self.group_index(group_name)] = new_name
+        for rhino_object in members.values():
+            rhino_object.groups[rhino_object.groups.index(group_name)] = new_name
+        self.writes += 1
+        return True
+
+    def delete_group(self, group_name):
+        members = self.groups.pop(group_name, None)
+        if members is None:
+            return False
+        for rhino_object in members.values():
+            rhino_object.groups.remove(group_name)
+        return True
+
+    def add_to_group(self, rhino_objects, group_name):
+        members = self.groups[group_name]
+        for rhino_object in rhino_objects:
+            if rhino_object.Id not in members:
+                members[rhino_object.Id] = rhino_object
+                rhino_object.groups.append(group_name)
+                self.writes += 1
+        return len(rhino_objects)
+
+    def dim_style(self, name):
+        for style in self.dim_styles:
+            if style.Name == name:
+                return style
+        return None
+
+    def summary(self):
+        # Tamaño de las tablas, incluidas las capas borradas que Rhino conserva
+        return {
+            "objects": len(self.objects),
+            "layer_table": len(self.layers),
+            "layers": len(self._layers_by_path),
+            "groups": len(self.group_table),
+            "redraws": self.redraws,
+            "writes": self.writes,
+            "blocks": len(self.blocks),
+        }
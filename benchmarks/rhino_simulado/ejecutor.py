@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Ejecuta un script de cotas contra el documento simulado, como lo haría
+# _-RunPythonScript, y devuelve el tiempo, las llamadas y lo que cambió en el documento.
+import importlib.abc
+import importlib.util
+import os
+import sys
+
+from . import medicion
+from . import rhinocommon
+from . import rhinoscriptsyntax
+from . import scriptcontext
+from . import system
+
+# Carpetas de scripts añadidas a sys.path: sus módulos forman la "sesión de Rhino"
+_script_dirs = set()
+
+class _NullOutput(object):
+    def write(self, text):
+        pass
+
+    def flush(self):
+        pass
+
+class _SourceLoader(importlib.abc.SourceLoader):
+    # Sin path_stats no hay caché de bytecode: el módulo se compila en cada importación
+    def __init__(self, path):
+        self.path = path
+
+    def get_filename(self, fullname):
+        return self.path
+
+    def get_data(self, path):
+        with open(path, "rb") as source:
+            return source.read()
+
+class _ScriptFolderFinder(importlib.abc.MetaPathFinder):
+    # IronPython no guarda .pyc: los módulos de la carpeta de scripts se compilan desde el
+    # .py cada vez que se importan, no desde __pycache__
+    def find_spec(self, fullname, path, target=None):
+        if path is not None:
+            return None
+        for script_dir in _script_dirs:
+            module_path = os.path.join(script_dir, fullname + ".py")
+            if os.path.isfile(module_path):
+                return importlib.util.spec_from_file_location(fullname, module_path,
+                                                              loader=_SourceLoader(module_path))
+        return None
+
+_finder = _ScriptFolderFinder()
+
+class ScriptRun(object):
+    def __init__(self, script_path, seconds, compile_seconds, first_prompt_seconds, calls, before, after, prompts,
+                 unused_answers):
+        self.script_path = script_path
+        # Todo el clic: compilar el script, importar lo que falte y ejecutarlo
+        self.seconds = seconds
+        self.compile_seconds = compile_seconds
+        # Desde el clic hasta la primera pregunta al usuario; None si el script no pregunta
+        self.first_prompt_seconds = first_prompt_seconds
+        self.calls = calls
+        self.before = before
+        self.after = after
+        self.prompts = prompts
+        self.unused_answers = unused_answers
+
+    @property
+    def rs_calls(self):
+        return sum(count for count, seconds in self.calls.values())
+
+    @property
+    def rs_seconds(self):
+        return sum(seconds for count, seconds in self.calls.values())
+
+    def growth(self, key):
+        return self.after[key] - self.before[key]
+
+def install(document=None):
+    # "import rhinoscriptsyntax as rs", "import scriptcontext as sc", "import Rhino" e "import System"
+    # resuelven a estos módulos
+    sys.modules["Rhino"] = rhinocommon
+    sys.modules["System"] = system
+    sys.modules["rhinoscriptsyntax"] = rhinoscriptsyntax
+    sys.modules["scriptcontext"] = scriptcontext
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
+    if document is not None:
+        scriptcontext.doc = document
+    return scriptcontext.doc
+
+def _compile(script_path):
+    # Como _-RunPythonScript, que lee y compila el archivo en cada clic
+    with open(script_path, "rb") as source:
+        return compile(source.read(), script_path, "exec")
+
+def new_session():
+    # Olvida los módulos importados por los scripts, como al abrir Rhino de nuevo:
+    # el siguiente clic vuelve a importarlos y compilarlos
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.dirname(os.path.abspath(module_file)) in _script_dirs:
+            del sys.modules[name]
+    scriptcontext.sticky.clear()
+    for event in (rhinocommon.RhinoDoc.LayerTableEvent, rhinocommon.RhinoDoc.AddRhinoObject):
+        del event.handlers[:]
+
+def run_script(script_path, answers=(), document=None, quiet=True):
+    script_path = os.path.abspath(script_path)
+    doc = install(document)
+    script_dir = os.path.dirname(script_path)
+    if script_dir not in sys.path:
+        # Rhino añade la carpeta del script para que encuentre cotas_constructor y compañía
+        sys.path.insert(0, script_dir)
+    _script_dirs.add(script_dir)
+
+    doc.push_answers(answers)
+    first_prompt = len(doc.prompts)
+    doc.first_prompt_clock = None
+    before = doc.summary()
+    medicion.stats.reset()
+    namespace = {"__name__": "__main__", "__file__": script_path}
+
+    stdout = sys.stdout
+    if quiet:
+        sys.stdout = _NullOutput()
+    start = medicion.clock()
+    compile_seconds = 0.0
+    try:
+        code = _compile(script_path)
+        compile_seconds = medicion.clock() - start
+        exec(code, namespace)
+    finally:
+        seconds = medicion.clock() - start
+        sys.stdout = stdout
+        unused_answers = len(doc.answers)
+        doc.answers.clear()
+
+    first_prompt_seconds = None
+    if doc.first_prompt_clock is not None:
+        first_prompt_seconds = doc.first_prompt_clock - start
+    return ScriptRun(script_path, seconds, compile_seconds, first_prompt_seconds, medicion.stats.snapshot(), before, doc.summary(),
+                     doc.prompts[first_prompt:], unused_answers)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Rhino.Geometry simulado: puntos como tuplas, planos con sus tres ejes y transformaciones
+# como matrices 4x4 por filas
+import math
+
+class Point3d(tuple):
+    __slots__ = ()
+
+    def __new__(cls, x, y=None, z=0.0):
+        if y is None:
+            point = x
+            x, y = point[0], point[1]
+            z = point[2] if len(point) > 2 else 0.0
+        return tuple.__new__(cls, (float(x), float(y), float(z)))
+
+    X = property(lambda self: self[0])
+    Y = property(lambda self: self[1])
+    Z = property(lambda self: self[2])
+
+def _unitize(vector):
+    length = math.sqrt(vector[0] ** 2 + vector[1] ** 2 + vector[2] ** 2)
+    if length == 0:
+        return Point3d(vector)
+    return Point3d(vector[0] / length, vector[1] / length, vector[2] / length)
+
+class Plane(object):
+    def __init__(self, origin, x_axis, y_axis):
+        self.Origin = Point3d(origin)
+        self.XAxis = _unitize(x_axis)
+        self.YAxis = _unitize(y_axis)
+        self.ZAxis = _unitize((self.XAxis[1] * self.YAxis[2] - self.XAxis[2] * self.YAxis[1],
+                               self.XAxis[2] * self.YAxis[0] - self.XAxis[0] * self.YAxis[2],
+                               self.XAxis[0] * self.YAxis[1] - self.XAxis[1] * self.YAxis[0]))
+
+    @classmethod
+    def world_xy(cls, origin=(0, 0, 0)):
+        return cls(origin, (1, 0, 0), (0, 1, 0))
+
+    def moved(self, vector):
+        origin = (self.Origin[0] + vector[0], self.Origin[1] + vector[1], self.Origin[2] + vector[2])
+        return Plane(origin, self.XAxis, self.YAxis)
+
+class Transform(object):
+    # Indexada como en RhinoCommon, xform[fila, columna]; recorrerla da sus filas
+    def __init__(self, diagonal=0.0):
+        self.rows = [[float(diagonal) if i == j else 0.0 for j in range(4)] for i in range(4)]
+
+    def __getitem__(self, key):
+        return self.rows[key[0]][key[1]]
+
+    def __setitem__(self, key, value):
+        self.rows[key[0]][key[1]] = float(value)
+
+    def __iter__(self):
+        return iter(self.rows)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Conteo y tiempo de cada llamada a rs.* y sc.doc.* hecha por un script.
+# El tiempo es el del documento simulado, no el de Rhino: sirve para comparar
+# cambios entre sí y, junto con el número de llamadas, para ver dónde se va cada cota.
+import time
+
+try:
+    _clock = time.perf_counter
+except AttributeError:
+    _clock = time.time
+
+class CallStats(object):
+    def __init__(self):
+        self.calls = {}
+        self.seconds = {}
+        self.depth = 0
+
+    def reset(self):
+        self.calls = {}
+        self.seconds = {}
+
+    def record(self, name, elapsed):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    def total_seconds(self):
+        return sum(self.seconds.values())
+
+    def snapshot(self):
+        return dict((name, (self.calls[name], self.seconds[name])) for name in self.calls)
+
+    def rows(self):
+        # (nombre, llamadas, segundos) de la llamada más costosa a la más barata
+        return sorted(((name, self.calls[name], self.seconds[name]) for name in self.calls),
+                      key=lambda row: (-row[2], row[0]))
+
+stats = CallStats()
+
+def clock():
+    return _clock()
+
+def measured(name, function):
+    # Solo cuenta las llamadas hechas desde el script, no las internas del simulador
+    def wrapper(*args, **kwargs):
+        if stats.depth:
+            return function(*args, **kwargs)
+        stats.depth += 1
+        start = _clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.depth -= 1
+            stats.record(name, _clock() - start)
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Lo mínimo de RhinoCommon que usan los scripts, instalado como módulo "Rhino".
+# Los espacios de nombres son clases anidadas: los scripts acceden a ellos
+# con "import Rhino" y Rhino.DocObjects..., nunca con "import Rhino.DocObjects".
+import os
+
+from . import geometria
+
+class Event(object):
+    # Evento .NET: los manejadores se añaden con += y se quitan con -=
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+        return self
+
+    def fire(self, sender, args):
+        for handler in list(self.handlers):
+            handler(sender, args)
+
+class LayerTableEventArgs(object):
+    def __init__(self, document, event_type, layer_index):
+        self.Document = document
+        self.EventType = event_type
+        self.LayerIndex = layer_index
+
+class RhinoObjectEventArgs(object):
+    def __init__(self, rhino_object):
+        self.TheObject = rhino_object
+        self.ObjectId = rhino_object.Id
+
+class RhinoDoc(object):
+    LayerTableEvent = Event()
+    AddRhinoObject = Event()
+
+class GeometryBase(object):
+    # Geometría suelta, fuera del documento: (tipo de objeto, valores) como en RhinoObject
+    def __init__(self, object_type, values):
+        self.object_type = object_type
+        self.values = dict(values)
+
+    def Duplicate(self):
+        return type(self)(self.object_type, self.values)
+
+class TextEntity(GeometryBase):
+    def __init__(self, object_type, values):
+        GeometryBase.__init__(self, object_type, values)
+        # Índice en sc.doc.Fonts; -1 conserva la tipografía de values
+        self.FontIndex = -1
+
+class Geometry(object):
+    Point3d = geometria.Point3d
+    Plane = geometria.Plane
+    Transform = geometria.Transform
+    GeometryBase = GeometryBase
+    TextEntity = TextEntity
+
+    class TextJustification(object):
+        pass
+
+class ObjectAttributes(object):
+    # Los colores son tuplas (r, g, b), como los que devuelve System.Drawing.Color.FromArgb simulado
+    def __init__(self):
+        self.LayerIndex = 0
+        self.ObjectColor = (0, 0, 0)
+        self.ColorSource = 0
+        self.PlotWeight = 0.0
+        self.PlotWeightSource = 0
+        self.Name = None
+        self.user_strings = {}
+        self.group_list = []
+
+    def GetGroupList(self):
+        # Índices en sc.doc.Groups, o None sin grupos, como en RhinoCommon
+        return list(self.group_list) or None
+
+    def SetUserString(self, key, value):
+        if value:
+            self.user_strings[key] = value
+        else:
+            self.user_strings.pop(key, None)
+        return True
+
+    def GetUserString(self, key):
+        return self.user_strings.get(key)
+
+    def Duplicate(self):
+        attributes = ObjectAttributes()
+        attributes.__dict__.update(self.__dict__)
+        attributes.user_strings = dict(self.user_strings)
+        attributes.group_list = list(self.group_list)
+        return attributes
+
+class DocObjects(object):
+    ObjectAttributes = ObjectAttributes
+
+    class ObjectColorSource(object):
+        ColorFromLayer = 0
+        ColorFromObject = 1
+        ColorFromMaterial = 2
+        ColorFromParent = 3
+
+    class ObjectPlotWeightSource(object):
+        PlotWeightFromLayer = 0
+        PlotWeightFromObject = 1
+        PlotWeightFromParent = 3
+
+    class Tables(object):
+        class LayerTableEventType(object):
+            Added = 0
+            Deleted = 1
+            Undeleted = 2
+            Modified = 3
+            Sorted = 4
+            Current = 5
+
+class File3dmObject(object):
+    def __init__(self, geometry, attributes):
+        self.Geometry = geometry
+        self.Attributes = attributes
+
+class FileLayer(object):
+    def __init__(self, name):
+        self.Name = name
+
+class File3dm(object):
+    # Los archivos se leen con la función que registren los escenarios para su nombre
+    readers = {}
+
+    class TableTypeFilter(object):
+        Layer = 64
+        ObjectTable = 8192
+
+    class ObjectTypeFilter(object):
+        Any = 0xFFFFFFFF
+
+    def __init__(self):
+        self.Objects = []
+        self.Layers = []
+
+    @staticmethod
+    def Read(path, table_filter=None, object_filter=None):
+        reader = File3dm.readers.get(os.path.basename(path))
+        return reader(path) if reader is not None else None
+
+class FileIO(object):
+    File3dm = File3dm
@@ -0,0 +1,653 @@
+# -*- coding: utf-8 -*-
+# rhinoscriptsyntax simulado sobre el documento en memoria de scriptcontext.doc.
+# Firmas y valores de retorno como los de Rhino 5; cada función pública queda
+# envuelta por medicion.measured al final del módulo.
+import math
+import types
+
+from . import medicion
+from . import scriptcontext
+from .documento import (InstanceDefinition, Plane, Point3d, offset_polyline, transform_point,
+                        OBJECT_CURVE, SOURCE_BY_OBJECT)
+
+class filter(object):
+    allobjects = 0
+    point = 1
+    pointcloud = 2
+    curve = 4
+    surface = 8
+    polysurface = 16
+    mesh = 32
+    light = 256
+    annotation = 512
+    instance = 4096
+    textdot = 8192
+    grip = 16384
+    detail = 32768
+    hatch = 65536
+    morph = 131072
+    cage = 134217728
+    phantom = 268435456
+    clippingplane = 536870912
+    extrusion = 1073741824
+
+def _doc():
+    return scriptcontext.doc
+
+def _object(object_id, raise_if_missing=True):
+    rhino_object = _doc().find_object(object_id)
+    if rhino_object is None and raise_if_missing:
+        raise ValueError("No existe el objeto {}".format(object_id))
+    return rhino_object
+
+def _objects(object_ids):
+    if object_ids is None:
+        return []
+    if not isinstance(object_ids, (list, tuple)):
+        object_ids = [object_ids]
+    return [rhino_object for rhino_object in (_object(object_id, False) for object_id in object_ids)
+            if rhino_object is not None]
+
+def _layer(layer, raise_if_missing=True):
+    found = _doc().find_layer(layer)
+    if found is None and raise_if_missing:
+        raise ValueError("No existe la capa {}".format(layer))
+    return found
+
+def _dim_style(name):
+    style = _doc().dim_style(name)
+    if style is None:
+        raise ValueError("No existe el estilo de cota {}".format(name))
+    return style
+
+def _get_set(rhino_object, attribute, value):
+    previous = getattr(rhino_object, attribute)
+    if value is not None:
+        setattr(rhino_object, attribute, value)
+    return previous
+
+# Capas
+def AddLayer(name=None, color=None, visible=True, locked=False, parent=None):
+    doc = _doc()
+    parent_layer = _layer(parent) if parent else None
+    if name is None:
+        name = "Layer {:02d}".format(len(doc.layers))
+    if "::" in name:
+        parent_path, name = name.rsplit("::", 1)
+        parent_layer = _layer(parent_path)
+    full_path = name if parent_layer is None else parent_layer.full_path + "::" + name
+    if doc.layer_by_path(full_path) is not None:
+        raise ValueError("The layer already exists.")
+    return doc.add_layer(name, parent_layer, color).full_path
+
+def IsLayer(layer):
+    return _layer(layer, False) is not None
+
+def CurrentLayer(layer=None):
+    doc = _doc()
+    previous = doc.current_layer.full_path
+    if layer is not None:
+        doc.set_current_layer(_layer(layer))
+    return previous
+
+def LayerNames(sort=False):
+    names = [layer.full_path for layer in _doc().active_layers()]
+    return sorted(names) if sort else names
+
+def LayerCount():
+    return len(_doc().layers)
+
+def LayerChildren(layer):
+    return [child.full_path for child in _layer(layer).children]
+
+def LayerChildCount(layer):
+    return len(_layer(layer).children)
+
+def IsLayerEmpty(layer):
+    return not _layer(layer).objects
+
+def LayerColor(layer, color=None):
+    layer = _layer(layer)
+    previous = layer.color
+    if color is not None:
+        _doc().modify_layer(layer, color=color)
+    return previous
+
+def LayerPrintWidth(layer, width=None):
+    layer = _layer(layer)
+    previous = layer.print_width
+    if width is not None:
+        _doc().modify_layer(layer, print_width=width)
+    return previous
+
+def RenameLayer(oldname, newname):
+    layer = _layer(oldname, False)
+    if layer is None or not newname:
+        return None
+    _doc().rename_layer(layer, newname)
+    return newname
+
+def DeleteLayer(layer):
+    layer = _layer(layer, False)
+    return bool(layer) and _doc().delete_layer(layer)
+
+def PurgeLayer(layer_name):
+    layer = _layer(layer_name, False)
+    return bool(layer) and _doc().delete_layer(layer)
+
+def ObjectsByLayer(layer_name, select=False):
+    layer = _layer(layer_name, False)
+    if layer is None:
+        return []
+    ids = list(layer.objects.keys())
+    if select:
+        SelectObjects(ids)
+    return ids
+
+# Objetos
+def IsObject(object_id):
+    return _object(object_id, False) is not None
+
+def AllObjects(select=False, include_lights=False, include_grips=False):
+    ids = list(_doc().objects.keys())
+    if select:
+        SelectObjects(ids)
+    return ids
+
+def ObjectType(object_id):
+    return _object(object_id).type
+
+def DeleteObject(object_id):
+    rhino_object = _object(object_id, False)
+    if rhino_object is None:
+        return False
+    _doc().delete_object(rhino_object)
+    return True
+
+def DeleteObjects(object_ids):
+    count = 0
+    for rhino_object in _objects(object_ids):
+        _doc().delete_object(rhino_object)
+        count += 1
+    return count
+
+def ObjectLayer(object_id, layer=None):
+    if isinstance(object_id, (list, tuple)):
+        target = _layer(layer)
+        rhino_objects = _objects(object_id)
+        for rhino_object in rhino_objects:
+            _doc().move_object_to_layer(rhino_object, target)
+        return len(rhino_objects)
+    rhino_object = _object(object_id)
+    previous = rhino_object.layer.full_path
+    if layer is not None:
+        _doc().move_object_to_layer(rhino_object, _layer(layer))
+    return previous
+
+def ObjectColor(object_ids, color=None):
+    rhino_objects = _objects(object_ids)
+    if color is None:
+        return rhino_objects[0].color
+    previous = rhino_objects[0].color if rhino_objects else None
+    for rhino_object in rhino_objects:
+        rhino_object.color = tuple(color)
+        rhino_object.color_source = SOURCE_BY_OBJECT
+    return previous if len(rhino_objects) == 1 else len(rhino_objects)
+
+def ObjectColorSource(object_ids, source=None):
+    rhino_objects = _objects(object_ids)
+    if source is None:
+        return rhino_objects[0].color_source
+    for rhino_object in rhino_objects:
+        rhino_object.color_source = source
+    return len(rhino_objects)
+
+def ObjectPrintWidth(object_ids, width=None):
+    rhino_objects = _objects(object_ids)
+    if width is None:
+        return rhino_objects[0].print_width
+    previous = rhino_objects[0].print_width if rhino_objects else None
+    for rhino_object in rhino_objects:
+        rhino_object.print_width = float(width)
+        rhino_object.print_width_source = SOURCE_BY_OBJECT
+    return previous if len(rhino_objects) == 1 else len(rhino_objects)
+
+def ObjectPrintWidthSource(object_ids, source=None):
+    rhino_objects = _objects(object_ids)
+    if source is None:
+        return rhino_objects[0].print_width_source
+    for rhino_object in rhino_objects:
+        rhino_object.print_width_source = source
+    return len(rhino_objects)
+
+def SetUserText(object_id, key, value=None, attach_to_geometry=False):
+    user_text = _object(object_id).user_text
+    if value:
+        user_text[key] = value
+    else:
+        user_text.pop(key, None)
+    return True
+
+def GetUserText(object_id, key=None, attach_to_geometry=False):
+    user_text = _object(object_id).user_text
+    if key is None:
+        return list(user_text.keys())
+    return user_text.get(key)
+
+def ObjectName(object_id, name=None):
+    return _get_set(_object(object_id), "name", name)
+
+def MoveObject(object_id, translation):
+    rhino_object = _object(object_id, False)
+    if rhino_object is None:
+        return None
+    rhino_object.move(translation)
+    return rhino_object.Id
+
+def BoundingBox(objects, view_or_plane=None, in_world_coords=True):
+    points = []
+    for rhino_object in _objects(objects):
+        points.extend(rhino_object.points())
+    if not points:
+        return None
+    xs, ys, zs = zip(*points)
+    x0, y0, z0, x1, y1, z1 = min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)
+    return [Point3d(x0, y0, z0), Point3d(x1, y0, z0), Point3d(x1, y1, z0), Point3d(x0, y1, z0),
+            Point3d(x0, y0, z1), Point3d(x1, y0, z1), Point3d(x1, y1, z1), Point3d(x0, y1, z1)]
+
+# Selección
+def SelectObjects(object_ids):
+    rhino_objects = _objects(object_ids)
+    for rhino_object in rhino_objects:
+        _doc().selected[rhino_object.Id] = rhino_object
+    return len(rhino_objects)
+
+def SelectObject(object_id):
+    return SelectObjects([object_id]) == 1
+
+def UnselectAllObjects():
+    doc = _doc()
+    count = len(doc.selected)
+    doc.selected.clear()
+    return count
+
+def SelectedObjects(include_lights=False, include_grips=False):
+    return list(_doc().selected.keys())
+
+def LastCreatedObjects(select=False):
+    ids = [object_id for object_id in _doc().last_created if object_id in _doc().objects]
+    if not ids:
+        return None
+    if select:
+        SelectObjects(ids)
+    return ids
+
+# Curvas y sombreados
+def AddLine(start, end):
+    return _doc().add_curve([start, end]).Id
+
+def AddPolyline(points, replace_id=None):
+    return _doc().add_curve(points).Id
+
+def IsCurve(object_id):
+    rhino_object = _object(object_id, False)
+    return rhino_object is not None and rhino_object.type == OBJECT_CURVE
+
+def IsLine(object_id, segment_index=-1):
+    return IsCurve(object_id) and len(_object(object_id).geometry["points"]) == 2
+
+def IsPolyline(object_id, segment_index=-1):
+    # Las curvas del simulador son todas polilíneas
+    return IsCurve(object_id)
+
+def PolylineVertices(curve_id, segment_index=-1):
+    rhino_object = _object(curve_id)
+    if rhino_object.type != OBJECT_CURVE:
+        return None
+    return list(rhino_object.geometry["points"])
+
+def CurveStartPoint(curve_id, segment_index=-1, point=None):
+    return _object(curve_id).geometry["points"][0]
+
+def CurveEndPoint(curve_id, segment_index=-1):
+    return _object(curve_id).geometry["points"][-1]
+
+def OffsetCurve(object_id, direction, distance, normal=None, style=1):
+    rhino_object = _object(object_id)
+    points = rhino_object.geometry["points"]
+    if len(points) < 2:
+        return None
+    return [_doc().add_curve(offset_polyline(points, direction, distance)).Id]
+
+def AddHatch(curve_id, hatch_pattern=None, scale=1.0, rotation=0.0):
+    boundary = _object(curve_id)
+    return _doc().add_hatch(boundary.geometry["points"], hatch_pattern or "Solid").Id
+
+# Texto y cotas
+def AddText(text, point_or_plane, height=1.0, font="Arial", font_style=0, justification=None):
+    if not isinstance(point_or_plane, Plane):
+        point_or_plane = Plane.world_xy(point_or_plane)
+    return _doc().add_text(str(text), point_or_plane, height, font, font_style, justification).Id
+
+def IsText(object_id):
+    rhino_object = _object(object_id, False)
+    return rhino_object is not None and "text" in rhino_object.geometry
+
+def TextObjectText(object_id, text=None):
+    geometry = _object(object_id).geometry
+    previous = geometry["text"]
+    if text is not None:
+        geometry["text"] = text
+    return previous
+
+def TextObjectPoint(object_id, point=None):
+    return _object(object_id).geometry["plane"].Origin
+
+def TextObjectFont(object_id, font=None):
+    geometry = _object(object_id).geometry
+    previous = geometry["font"]
+    if font is not None:
+        geometry["font"] = font
+    return previous
+
+def TextObjectHeight(object_id, height=None):
+    geometry = _object(object_id).geometry
+    previous = geometry["height"]
+    if height is not None:
+        geometry["height"] = height
+    return previous
+
+def PlaneFromFrame(origin, x_axis, y_axis):
+    return Plane(origin, x_axis, y_axis)
+
+def AddLinearDimension(plane, start_point, end_point, point_on_dimension_line):
+    return _doc().add_dimension(plane, start_point, end_point, point_on_dimension_line).Id
+
+def IsDimension(object_id):
+    rhino_object = _object(object_id, False)
+    return rhino_object is not None and "start" in rhino_object.geometry
+
+def DimensionValue(annotation_id):
+    geometry = _object(annotation_id).geometry
+    axis = geometry["plane"].XAxis
+    delta = [b - a for a, b in zip(geometry["start"], geometry["end"])]
+    return abs(sum(d * a for d, a in zip(delta, axis)))
+
+def DimensionText(annotation_id):
+    geometry = _object(annotation_id).geometry
+    if geometry.get("user_text"):
+        return geometry["user_text"]
+    return "{:.2f}".format(DimensionValue(annotation_id))
+
+def DimensionUserText(annotation_id, usertext=None):
+    geometry = _object(annotation_id).geometry
+    previous = geometry["user_text"]
+    if usertext is not None:
+        geometry["user_text"] = usertext
+    return previous
+
+def DimensionStyle(annotation_id, dimstyle_name=None):
+    geometry = _object(annotation_id).geometry
+    previous = geometry["style"]
+    if dimstyle_name is not None:
+        _dim_style(dimstyle_name)
+        geometry["style"] = dimstyle_name
+    return previous
+
+# Estilos de cota
+def DimStyleNames(sort=False):
+    names = [style.Name for style in _doc().dim_styles]
+    return sorted(names) if sort else names
+
+def IsDimStyle(dimstyle):
+    return _doc().dim_style(dimstyle) is not None
+
+def CurrentDimStyle(dimstyle_name=None):
+    doc = _doc()
+    previous = doc.current_dim_style
+    if dimstyle_name is not None:
+        _dim_style(dimstyle_name)
+        doc.current_dim_style = dimstyle_name
+    return previous
+
+def AddDimStyle(dimstyle_name=None):
+    doc = _doc()
+    if dimstyle_name is None:
+        dimstyle_name = "Dimension Style {:02d}".format(len(doc.dim_styles))
+    if doc.dim_style(dimstyle_name) is not None:
+        return None
+    style = doc.dim_style(doc.current_dim_style).copy()
+    style.Name = dimstyle_name
+    doc.dim_styles.append(style)
+    return dimstyle_name
+
+def _dim_style_property(attribute):
+    def property_function(dimstyle, value=None):
+        style = _dim_style(dimstyle)
+        previous = getattr(style, attribute)
+        if value is not None:
+            setattr(style, attribute, value)
+        return previous
+    return property_function
+
+DimStyleExtension = _dim_style_property("ExtensionLineExtension")
+DimStyleOffset = _dim_style_property("ExtensionLineOffset")
+DimStyleTextGap = _dim_style_property("TextGap")
+DimStyleTextHeight = _dim_style_property("TextHeight")
+DimStyleArrowSize = _dim_style_property("ArrowLength")
+DimStyleFont = _dim_style_property("Font")
+DimStyleTextAlignment = _dim_style_property("TextAlignment")
+
+# Grupos
+def AddGroup(group_name=None):
+    return _doc().add_group(group_name)
+
+def IsGroup(group_name):
+    return group_name in _doc().groups
+
+def GroupNames():
+    names = list(_doc().groups.keys())
+    return names or None
+
+def AddObjectsToGroup(object_ids, group_name):
+    doc = _doc()
+    if group_name not in doc.groups:
+        raise ValueError("No existe el grupo {}".format(group_name))
+    return doc.add_to_group(_objects(object_ids), group_name)
+
+def AddObjectToGroup(object_id, group_name):
+    return AddObjectsToGroup([object_id], group_name) == 1
+
+def ObjectsByGroup(group_name, select=False):
+    members = _doc().groups.get(group_name)
+    if not members:
+        return []
+    ids = list(members.keys())
+    if select:
+        SelectObjects(ids)
+    return ids
+
+def DeleteGroup(group_name):
+    return _doc().delete_group(group_name)
+
+def ObjectGroups(object_id):
+    return list(_object(object_id).groups)
+
+# Bloques
+def AddBlock(object_ids, base_point, name=None, delete_input=False):
+    doc = _doc()
+    if name is None:
+        name = "Block {:02d}".format(len(doc.blocks) + 1)
+    if name in doc.blocks:
+        return None
+    rhino_objects = _objects(object_ids)
+    geometry = [(rhino_object.type, dict(rhino_object.geometry)) for rhino_object in rhino_objects]
+    doc.blocks[name] = InstanceDefinition(doc.new_id(), name, geometry, Point3d(base_point))
+    if delete_input:
+        for rhino_object in rhino_objects:
+            doc.delete_object(rhino_object)
+    return name
+
+def IsBlock(block_name):
+    return block_name in _doc().blocks
+
+def BlockNames(sort=False):
+    names = list(_doc().blocks.keys())
+    return sorted(names) if sort else names
+
+def BlockDescription(block_name, description=None):
+    definition = _doc().blocks.get(block_name)
+    if definition is None:
+        raise ValueError("No existe el bloque {}".format(block_name))
+    previous = definition.Description
+    if description is not None:
+        definition.Description = description
+    return previous
+
+def InsertBlock2(block_name, xform):
+    doc = _doc()
+    if block_name not in doc.blocks:
+        raise ValueError("No existe el bloque {}".format(block_name))
+    return doc.add_instance(block_name, [list(row) for row in xform]).Id
+
+def InsertBlock(block_name, insertion_point, scale=(1, 1, 1), angle_degrees=0, rotation_normal=(0, 0, 1)):
+    cos_a, sin_a = math.cos(math.radians(angle_degrees)), math.sin(math.radians(angle_degrees))
+    point = Point3d(insertion_point)
+    xform = [[cos_a * scale[0], -sin_a * scale[1], 0.0, point[0]],
+             [sin_a * scale[0], cos_a * scale[1], 0.0, point[1]],
+             [0.0, 0.0, float(scale[2]), point[2]],
+             [0.0, 0.0, 0.0, 1.0]]
+    return InsertBlock2(block_name, xform)
+
+def BlockInstanceInsertPoint(object_id):
+    return transform_point(_object(object_id).geometry["xform"], (0, 0, 0))
+
+# Documento
+def GetDocumentData(section=None, entry=None):
+    data = _doc().data
+    if section is None:
+        return sorted(set(key[0] for key in data)) or None
+    if entry is None:
+        return sorted(key[1] for key in data if key[0] == section) or None
+    return data.get((section, entry))
+
+def SetDocumentData(section, entry, value):
+    data = _doc().data
+    previous = data.get((section, entry))
+    data[(section, entry)] = value
+    return previous
+
+def UnitAbsoluteTolerance(tolerance=None, in_model_units=True):
+    doc = _doc()
+    previous = doc.tolerance
+    if tolerance is not None:
+        doc.tolerance = tolerance
+    return previous
+
+def EnableRedraw(enable=True):
+    views = _doc().Views
+    previous = views.RedrawEnabled
+    views.RedrawEnabled = enable
+    if enable and not previous:
+        _doc().redraws += 1
+    return previous
+
+def Redraw():
+    _doc().redraws += 1
+
+# Interacción con respuestas guionizadas
+def GetPoint(message=None, base_point=None, distance=None, in_plane=False):
+    point = _doc().next_answer("GetPoint", message)
+    return Point3d(point) if point is not None else None
+
+def GetObject(message=None, filter=0, preselect=False, select=False, custom_filter=None, subobjects=False):
+    if not preselect:
+        _doc().selected.clear()
+    answer = _doc().next_answer("GetObject", message)
+    rhino_object = _object(answer, False) if answer is not None else None
+    if rhino_object is None:
+        return None
+    if select:
+        SelectObjects([rhino_object.Id])
+    return rhino_object.Id
+
+def GetObjects(message=None, filter=0, group=True, preselect=False, select=False, objects=None,
+               minimum_count=1, maximum_count=0, custom_filter=None):
+    if not preselect:
+        _doc().selected.clear()
+    answer = _doc().next_answer("GetObjects", message)
+    ids = [rhino_object.Id for rhino_object in _objects(answer)]
+    if not ids:
+        return None
+    if select:
+        SelectObjects(ids)
+    return ids
+
+def GetReal(message="Number", number=None, minimum=None, maximum=None):
+    answer = _doc().next_answer("GetReal", message)
+    return float(answer) if answer is not None else None
+
+def GetInteger(message=None, number=None, minimum=None, maximum=None):
+    answer = _doc().next_answer("GetInteger", message)
+    return int(answer) if answer is not None else None
+
+def GetString(message=None, defaultString=None, strings=None):
+    return _doc().next_answer("GetString", message)
+
+def MessageBox(message, buttons=0, title=""):
+    _doc().messages.append(message)
+    return 1
+
+def Command(commandString, echo=True):
+    return _doc().run_command(commandString)
+
+# Funciones que en Rhino 5 terminan con sc.doc.Views.Redraw(); las de consulta y edición
+# solo cuando modifican
+_REDRAWING = ("AddLine", "AddPolyline", "AddText", "AddLinearDimension", "AddHatch", "InsertBlock",
+              "InsertBlock2", "MoveObject", "DeleteObject", "DeleteObjects", "OffsetCurve",
+              "SelectObjects", "SelectObject", "UnselectAllObjects", "Command")
+_REDRAWING_WHEN_SETTING = ("ObjectColor", "ObjectPrintWidth", "ObjectLayer", "LayerColor",
+                           "LayerPrintWidth", "TextObjectText", "TextObjectFont")
+
+def _redrawing(function, setter_arguments=0):
+    def wrapper(*args, **kwargs):
+        top_level = not medicion.stats.depth
+        result = function(*args, **kwargs)
+        if top_level and len(args) + len(kwargs) > setter_arguments and _doc().Views.RedrawEnabled:
+            _doc().redraws += 1
+        return result
+    wrapper.__name__ = function.__name__
+    return wrapper
+
+# Funciones que cambian atributos o geometría de objetos ya creados: una escritura por objeto.
+# Las altas, bajas y cambios de capa las cuenta el documento.
+_WRITING = {"MoveObject": 0}
+_WRITING_WHEN_SETTING = {"ObjectColor": 1, "ObjectColorSource": 1, "ObjectPrintWidth": 1,
+                         "ObjectPrintWidthSource": 1, "ObjectName": 1, "TextObjectText": 1,
+                         "TextObjectFont": 1, "TextObjectHeight": 1, "DimensionStyle": 1,
+                         "DimensionUserText": 1, "SetUserText": 2}
+
+def _writing(function, setter_arguments):
+    def wrapper(*args, **kwargs):
+        top_level = not medicion.stats.depth
+        result = function(*args, **kwargs)
+        if top_level and len(args) + len(kwargs) > setter_arguments:
+            object_ids = args[0] if args else None
+            _doc().writes += len(object_ids) if isinstance(object_ids, (list, tuple)) else 1
+        return result
+    wrapper.__name__ = function.__name__
+    return wrapper
+
+for _name, _value in list(globals().items()):
+    if isinstance(_value, types.FunctionType) and not _name.startswith("_"):
+        _value = medicion.measured(_name, _value)
+        if _name in _WRITING:
+            _value = _writing(_value, _WRITING[_name])
+        elif _name in _WRITING_WHEN_SETTING:
+            _value = _writing(_value, _WRITING_WHEN_SETTING[_name])
+        if _name in _REDRAWING:
+            _value = _redrawing(_value)
+        elif _name in _REDRAWING_WHEN_SETTING:
+            _value = _redrawing(_value, 1)
+        globals()[_name] = _value
+del _name, _value
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+# scriptcontext simulado: doc es el documento en memoria activo (ver rhino_simulado.install)
+from .documento import Document
+
+doc = Document()
+sticky = {}
+
+def escape_test(throw_exception=True, reset=False):
+    pressed = doc.escape_pending
+    if reset:
+        doc.escape_pending = False
+    if pressed and throw_exception:
+        raise KeyboardInterrupt("escape key pressed")
+    return pressed
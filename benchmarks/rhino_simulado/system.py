@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+# Lo mínimo de .NET que usan los scripts, instalado como módulo "System"
+import uuid
+
+class Enum(object):
+    @staticmethod
+    def ToObject(enum_type, value):
+        return value
+
+class Guid(object):
+    Empty = uuid.UUID(int=0)
+
+class Drawing(object):
+    class Color(object):
+        @staticmethod
+        def FromArgb(*components):
+            # (r, g, b) o (a, r, g, b); el documento simulado guarda (r, g, b)
+            return tuple(components[-3:])